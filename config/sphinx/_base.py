@@ -0,0 +1,158 @@
+"""
+Shared Sphinx configuration for Timekeeper API documentation.
+
+Each ``conf.py`` star-imports this module and then adds only what is specific
+to its own tree (usually the ``sys.path`` entry autodoc needs). Keeping a
+single source of settings stops the builds drifting apart, and options that
+change between builds would otherwise invalidate Sphinx's pickled
+environment.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+# Repository root, independent of which conf.py imported this module
+_repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+# Project information
+project = "Timekeeper"
+copyright = f"{datetime.now().year}, Timekeeper Contributors"
+author = "Timekeeper Contributors"
+version = "0.1.0"
+release = "0.1.0"
+
+# Extensions
+extensions = [
+    "sphinx.ext.autodoc",  # Auto-documentation from docstrings
+    "sphinx.ext.napoleon",  # Support for NumPy and Google style docstrings
+    "sphinx.ext.linkcode",  # Link to source code on GitHub
+    "sphinx.ext.mathjax",  # LaTeX support
+    "sphinx_autodoc_typehints",  # Type hints support
+    "sphinx_copybutton",  # Add copy button to code blocks
+    "sphinx.ext.intersphinx",  # Link to other documentation
+]
+
+# Theme configuration
+html_theme = "furo"  # Modern, responsive theme
+html_title = "Timekeeper API Documentation"
+html_short_title = "Timekeeper API"
+html_static_path = ["_static"]
+templates_path = ["_templates"]
+exclude_patterns = [
+    "_build/**",
+    "**/_build/**",
+    "Thumbs.db",
+    ".DS_Store",
+    "**/.ipynb_checkpoints",
+]
+
+# Don't copy reST sources into the output or link to them from each page.
+# The general index stays enabled because index.rst links to genindex.
+html_copy_source = False
+html_show_sourcelink = False
+
+# Napoleon settings for docstring parsing
+napoleon_google_docstring = True
+napoleon_numpy_docstring = True
+napoleon_include_init_with_doc = True
+napoleon_include_private_with_doc = False
+napoleon_use_admonition_for_examples = True
+napoleon_use_admonition_for_notes = True
+napoleon_use_admonition_for_references = True
+napoleon_use_ivar = True
+napoleon_use_param = True
+napoleon_use_rtype = True
+napoleon_use_keyword = True
+
+# Custom sections for theory references
+napoleon_custom_sections = ["References", "Theoretical Foundation"]
+
+# Add cross-references to the theory documentation
+# Sphinx >= 2.0 already fetches these inventories concurrently, so new
+# entries only cost one round-trip; the timeout keeps an unreachable remote
+# inventory from stalling a cold build.
+intersphinx_mapping = {
+    "theory": (os.path.join(_repo_root, "_build/theory"), None),
+}
+intersphinx_timeout = 10
+
+# Other settings
+add_module_names = False
+autodoc_member_order = "bysource"
+autoclass_content = "both"
+
+# Pygments syntax highlighting
+pygments_style = "sphinx"
+pygments_dark_style = "monokai"
+
+# Skip the docutils smartquotes transform, which visits every text node
+smartquotes = False
+
+# HTML output settings
+html_theme_options = {
+    "sidebar_hide_name": False,
+    "light_css_variables": {
+        "color-brand-primary": "#1565c0",  # Primary color
+        "color-brand-content": "#1565c0",  # Content links
+        "color-api-name": "#0d47a1",  # API names
+        "color-api-pre-name": "#0d47a1",  # API prefix
+    },
+    "dark_css_variables": {
+        "color-brand-primary": "#42a5f5",  # Primary color (dark mode)
+        "color-brand-content": "#42a5f5",  # Content links (dark mode)
+        "color-api-name": "#90caf9",  # API names (dark mode)
+        "color-api-pre-name": "#90caf9",  # API prefix (dark mode)
+    },
+}
+
+# Enable "Edit on GitHub" links
+html_context = {
+    "display_github": True,
+    "github_user": "verlyn13",
+    "github_repo": "timekeeper",
+    "github_version": "main",
+    "conf_py_path": "/config/sphinx/",
+}
+
+# Add any paths that contain custom static files
+html_static_path = ["_static"]
+html_css_files = [
+    "custom.css",
+]
+
+# Add logo if available
+# html_logo = "_static/logo.png"
+# html_favicon = "_static/favicon.ico"
+
+# Add extra options for the RTD theme
+# html_theme_options.update({
+#     "repository_url": "https://github.com/verlyn13/timekeeper",
+#     "use_repository_button": True,
+# })
+
+
+# Source links point at GitHub (sphinx.ext.linkcode) instead of rendering
+# highlighted copies of every module during the build (sphinx.ext.viewcode)
+_source_url = "https://github.com/verlyn13/timekeeper/blob/main"
+
+
+def linkcode_resolve(domain, info):
+    """Return the GitHub URL of the file that defines a documented object."""
+    if domain != "py" or not info.get("module"):
+        return None
+    module = sys.modules.get(info["module"])
+    filename = getattr(module, "__file__", None)
+    if not filename:
+        return None
+    path = os.path.relpath(filename, _repo_root).replace(os.sep, "/")
+    return f"{_source_url}/{path}"
+
+
+def setup(app):
+    """Declare this configuration safe for parallel (-j) builds."""
+    return {
+        "version": release,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
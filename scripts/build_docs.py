@@ -9,20 +9,24 @@ This script coordinates the building of all documentation components:
 - Combined site using Quarto (if available)
 
 Usage:
-    python scripts/build_docs.py [--serve] [--skip-quarto]
+    python scripts/build_docs.py [--serve] [--skip-quarto] [--clean]
 
 Options:
     --serve       After building, serve the documentation for preview
     --skip-quarto Skip Quarto rendering (useful if Quarto is not installed)
+    --clean       Discard the cached Sphinx doctrees and rebuild from scratch
 """
 import argparse
 import os
+import shutil
 import subprocess
 import sys
-import http.server
-import socketserver
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import importlib.util
+
+# Sphinx pickles its parsed environment here; keeping it between runs lets
+# sphinx-build re-read only the sources that changed.
+DOCTREE_DIR = Path("_build/doctrees")
 
 
 def ensure_directory(dir_path):
@@ -31,25 +35,41 @@ def ensure_directory(dir_path):
 
 
 def run_command(cmd, cwd=None, check=True):
-    """Run a shell command and print its output."""
+    """
+    Run a shell command, streaming its output as it is produced.
+
+    Returns True if the command exited with status 0. With check=True a
+    non-zero exit status is also reported as an error.
+    """
     print(f"Running: {' '.join(cmd)}")
     try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=check, text=True, capture_output=True
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
         )
-        print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e}")
-        print(e.stderr)
-        return False
     except FileNotFoundError as e:
         print(f"Command not found: {e}")
         return False
 
+    # Forward output line by line instead of buffering the whole transcript
+    with process.stdout:
+        for line in process.stdout:
+            sys.stdout.write(line)
+    returncode = process.wait()
+
+    if returncode != 0:
+        if check:
+            print(f"Error: command exited with status {returncode}")
+        return False
+    return True
+
 
 def run_script(script_path):
-    """Run a Python script and check for errors."""
+    """Run a Python script in a separate interpreter and check for errors."""
     print(f"Running {script_path}...")
 
     # Check if the script exists
@@ -57,28 +77,8 @@ def run_script(script_path):
         print(f"Script not found: {script_path}")
         return False
 
-    # Import the script as a module and run its main function
-    module_name = Path(script_path).stem
-    spec = importlib.util.spec_from_file_location(module_name, script_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    try:
-        # If the module has a main function, call it
-        if hasattr(module, "main"):
-            module.main()
-            return True
-        # Otherwise, call its primary function if available
-        elif hasattr(module, "build_theory_docs"):
-            return module.build_theory_docs()
-        elif hasattr(module, "build_api_docs"):
-            return module.build_api_docs()
-        else:
-            print(f"No entry point found in {script_path}")
-            return False
-    except Exception as e:
-        print(f"Error running {script_path}: {e}")
-        return False
+    # A fresh interpreter keeps each build's sys.path and logging isolated
+    return run_command([sys.executable, "-u", script_path])
 
 
 def build_theory_docs():
@@ -88,7 +88,20 @@ def build_theory_docs():
 
 def build_api_docs():
     """Build API documentation."""
-    return run_script("scripts/build/api_build.py")
+    # -j auto lets Sphinx fan document reading out across all cores
+    return run_command(
+        [
+            "sphinx-build",
+            "-j",
+            "auto",
+            "-b",
+            "html",
+            "-d",
+            str(DOCTREE_DIR / "api"),
+            "config/sphinx",
+            "_build/api",
+        ]
+    )
 
 
 def build_quarto_docs(skip_quarto=False, serve=False):
@@ -199,6 +212,10 @@ def create_fallback_index():
 
 def serve_documentation(directory="_build/site", port=8080):
     """Serve the documentation from the specified directory."""
+    # Only needed for --serve, so keep them off the import path of a plain build
+    import http.server
+    import socketserver
+
     print(f"Serving documentation from {directory} on port {port}...")
 
     # Change to the directory containing the built documentation
@@ -222,18 +239,29 @@ def main():
     parser.add_argument(
         "--skip-quarto", action="store_true", help="Skip Quarto rendering"
     )
+    parser.add_argument(
+        "--clean", action="store_true", help="Discard cached doctrees first"
+    )
     args = parser.parse_args()
 
-    # Ensure the build directory exists
+    if args.clean and DOCTREE_DIR.exists():
+        print(f"Removing cached doctrees in {DOCTREE_DIR}...")
+        shutil.rmtree(DOCTREE_DIR)
+
+    # Ensure the build and doctree cache directories exist
     ensure_directory("_build/site")
+    ensure_directory(DOCTREE_DIR / "api")
+    ensure_directory(DOCTREE_DIR / "theory")
+
+    # Theory and API builds are independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        theory_future = executor.submit(build_theory_docs)
+        api_future = executor.submit(build_api_docs)
+        theory_success = theory_future.result()
+        api_success = api_future.result()
 
-    # Build theory documentation
-    theory_success = build_theory_docs()
     if not theory_success:
         print("Warning: Theory documentation build had issues.")
-
-    # Build API documentation
-    api_success = build_api_docs()
     if not api_success:
         print("Warning: API documentation build had issues.")
 
@@ -18,31 +18,137 @@ Options:
 """
 
 import argparse
+import ast
+import functools
+import hashlib
+import itertools
+import json
 import os
 import re
 import sys
-import glob
+import threading
 import yaml
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+# Patterns shared by the checks, compiled once at import time
+LATEX_DEFINITION_RE = re.compile(
+    r"\\begin{(definition|theorem|axiom|property)}\[(.*?)\](.*?)\\end{\1}", re.DOTALL
+)
+DEFINITION_CALLOUT_RE = re.compile(
+    r":::\s*\.callout-note\s*## Definition \d+: (.*?)\s+", re.DOTALL
+)
+QMD_LINK_RE = re.compile(r"\[.*?\]\((.*?)\.qmd\)")
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    YamlLoader = yaml.SafeLoader
+
+# Extraction results persisted between runs, keyed by a hash of the source
+CACHE_DIR = Path("_build/.cache")
+
+
+@dataclass(frozen=True)
+class QmdScan:
+    """Everything the checks extract from a single Quarto document."""
+
+    path: str
+    metadata: dict
+    links: tuple
+    definition_refs: tuple
+
 
 def ensure_directory(dir_path):
     """Ensure a directory exists."""
     Path(dir_path).mkdir(parents=True, exist_ok=True)
 
 
-def extract_definitions_from_latex(file_path):
-    """Extract definitions, theorems, etc. from a LaTeX file."""
-    if not os.path.exists(file_path):
-        return {}
-
-    definitions = {}
+@functools.lru_cache(maxsize=None)
+def _read_text_cached(file_path, mtime):
     with open(file_path, "r") as f:
-        content = f.read()
+        return f.read()
+
+
+def read_text(file_path):
+    """Read a file, reusing the cached contents while its mtime is unchanged."""
+    return _read_text_cached(file_path, os.path.getmtime(file_path))
+
+
+class ContentCache:
+    """
+    JSON map from the SHA-1 of a file's contents to a value derived from it.
+
+    Values are stored as JSON, so they come back as plain dicts, lists and
+    strings; other values (such as dates in YAML front matter) are stored as
+    strings, and computed values are returned in that same form. Lookups are
+    thread-safe. Only entries used during the current run are written back
+    by save(), so results for deleted or edited files expire.
+    """
+
+    def __init__(self, name):
+        self.path = CACHE_DIR / f"{name}.json"
+        self._entries = None
+        self._used = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path, "r") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+            if not isinstance(self._entries, dict):
+                self._entries = {}
+        return self._entries
+
+    def get(self, content, compute):
+        """Return compute(content), reusing the stored result for known content."""
+        key = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        with self._lock:
+            entries = self._load()
+            if key in entries:
+                self._used[key] = entries[key]
+                return entries[key]
+
+        # Round trip through JSON so the value matches a cached one
+        value = json.loads(json.dumps(compute(content), default=str))
+        with self._lock:
+            entries[key] = value
+            self._used[key] = value
+            self._dirty = True
+        return value
+
+    def save(self):
+        """Write the entries used in this run back to disk."""
+        if not self._dirty and len(self._used) == len(self._entries or {}):
+            return
+        ensure_directory(CACHE_DIR)
+        with open(self.path, "w") as f:
+            json.dump(self._used, f)
+
+
+LATEX_CACHE = ContentCache("latex_defs")
+DOCSTRING_CACHE = ContentCache("py_docstrings")
+METADATA_CACHE = ContentCache("qmd_metadata")
+
+
+def save_caches():
+    """Persist all extraction caches."""
+    for cache in (LATEX_CACHE, DOCSTRING_CACHE, METADATA_CACHE):
+        cache.save()
+
+
+def _parse_latex_definitions(content):
+    definitions = {}
 
     # Find all definitions, theorems, etc.
-    pattern = r"\\begin{(definition|theorem|axiom|property)}\[(.*?)\](.*?)\\end{\1}"
-    matches = re.findall(pattern, content, re.DOTALL)
+    matches = LATEX_DEFINITION_RE.findall(content)
 
     for match in matches:
         def_type = match[0]
@@ -53,42 +159,48 @@ def extract_definitions_from_latex(file_path):
     return definitions
 
 
-def extract_docstrings_from_python(file_path):
-    """Extract docstrings from Python files."""
+def extract_definitions_from_latex(file_path):
+    """Extract definitions, theorems, etc. from a LaTeX file."""
     if not os.path.exists(file_path):
         return {}
 
-    docstrings = {}
-    with open(file_path, "r") as f:
-        content = f.read()
+    return LATEX_CACHE.get(read_text(file_path), _parse_latex_definitions)
 
-    # Find class and method docstrings
-    class_pattern = r'class\s+(\w+).*?:\s*"""(.*?)"""'
-    method_pattern = r'def\s+(\w+).*?:\s*"""(.*?)"""'
 
-    for pattern, prefix in [(class_pattern, "class"), (method_pattern, "method")]:
-        matches = re.findall(pattern, content, re.DOTALL)
-        for match in matches:
-            name = match[0]
-            docstring = match[1].strip()
-            docstrings[f"{prefix}:{name}"] = docstring
+def _parse_python_docstrings(content):
+    docstrings = {}
+    tree = ast.parse(content)
+
+    # Walk the whole tree so nested and decorated definitions are included
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            prefix = "class"
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            prefix = "method"
+        else:
+            continue
+        docstrings[f"{prefix}:{node.name}"] = ast.get_docstring(node) or ""
 
     return docstrings
 
 
-def extract_metadata_from_qmd(file_path):
-    """Extract YAML metadata from a Quarto document."""
+def extract_docstrings_from_python(file_path):
+    """Extract docstrings from Python files."""
     if not os.path.exists(file_path):
         return {}
 
-    with open(file_path, "r") as f:
-        content = f.read()
+    return DOCSTRING_CACHE.get(read_text(file_path), _parse_python_docstrings)
 
+
+def _parse_frontmatter(content):
     if content.startswith("---"):
-        # Extract YAML frontmatter
-        _, frontmatter, _ = content.split("---", 2)
+        # Extract YAML frontmatter, stopping at the closing delimiter rather
+        # than splitting the whole document body
+        end = content.find("---", 3)
+        if end == -1:
+            return {}
         try:
-            metadata = yaml.safe_load(frontmatter)
+            metadata = yaml.load(content[3:end], Loader=YamlLoader)
             return metadata
         except yaml.YAMLError:
             return {}
@@ -96,35 +208,91 @@ def extract_metadata_from_qmd(file_path):
     return {}
 
 
-def check_metadata_consistency():
-    """Check for consistent metadata across Quarto documents."""
-    print("Checking metadata consistency...")
+def extract_metadata_from_qmd(file_path):
+    """Extract YAML metadata from a Quarto document."""
+    if not os.path.exists(file_path):
+        return {}
+
+    return _extract_metadata_cached(file_path, os.path.getmtime(file_path))
+
 
-    qmd_files = glob.glob("quarto/**/*.qmd", recursive=True)
+@functools.lru_cache(maxsize=None)
+def _extract_metadata_cached(file_path, mtime):
+    return METADATA_CACHE.get(read_text(file_path), _parse_frontmatter)
+
+
+def scan_qmd(file_path):
+    """Extract metadata, links and definition references from a Quarto document."""
+    return _scan_qmd_cached(file_path, os.path.getmtime(file_path))
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_qmd_cached(file_path, mtime):
+    content = read_text(file_path)
+    return QmdScan(
+        path=file_path,
+        metadata=extract_metadata_from_qmd(file_path),
+        links=tuple(match.strip() for match in QMD_LINK_RE.findall(content)),
+        definition_refs=tuple(
+            match.strip() for match in DEFINITION_CALLOUT_RE.findall(content)
+        ),
+    )
 
-    # Required metadata fields
-    required_fields = ["title", "description", "date", "status"]
-    status_values = ["Draft", "Review", "Stable", "Experimental", "Deprecated"]
 
+def find_qmd_files():
+    """Lazily yield every Quarto document in the project."""
+    return Path("quarto").rglob("*.qmd")
+
+
+def map_files(func, file_paths):
+    """
+    Apply func to every file on a thread pool and concatenate the issue lists.
+
+    The scans are dominated by blocking reads, which release the GIL, so
+    threads overlap the I/O. Each call returns its own list and results are
+    joined in input order, so no state is shared between workers.
+    """
     issues = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for file_issues in executor.map(func, file_paths):
+            issues.extend(file_issues)
+    return issues
 
-    for file_path in qmd_files:
-        metadata = extract_metadata_from_qmd(file_path)
 
-        # Check for required fields
-        for field in required_fields:
-            if field not in metadata:
-                issues.append(f"Missing '{field}' in {file_path}")
+# Required metadata fields
+REQUIRED_METADATA_FIELDS = ["title", "description", "date", "status"]
+STATUS_VALUES = ["Draft", "Review", "Stable", "Experimental", "Deprecated"]
 
-        # Check status values
-        if "status" in metadata and metadata["status"] not in status_values:
-            issues.append(
-                f"Invalid status '{metadata['status']}' in {file_path}. Valid values: {', '.join(status_values)}"
-            )
+
+def _metadata_issues(file_path):
+    """Return the metadata problems in a single Quarto document."""
+    metadata = scan_qmd(file_path).metadata
+    issues = []
+
+    # Check for required fields
+    for field in REQUIRED_METADATA_FIELDS:
+        if field not in metadata:
+            issues.append(f"Missing '{field}' in {file_path}")
+
+    # Check status values
+    if "status" in metadata and metadata["status"] not in STATUS_VALUES:
+        issues.append(
+            f"Invalid status '{metadata['status']}' in {file_path}. Valid values: {', '.join(STATUS_VALUES)}"
+        )
 
     return issues
 
 
+def check_metadata_consistency(qmd_files=None):
+    """Check for consistent metadata across Quarto documents."""
+    print("Checking metadata consistency...")
+
+    if qmd_files is None:
+        qmd_files = find_qmd_files()
+
+    return map_files(_metadata_issues, qmd_files)
+
+
 def check_math_consistency():
     """Check for consistent mathematical definitions across code and documentation."""
     print("Checking mathematical consistency...")
@@ -134,21 +302,15 @@ def check_math_consistency():
 
     # Extract docstrings from Python
     python_docstrings = {}
-    for py_file in glob.glob("src/python/*.py"):
+    for py_file in Path("src/python").glob("*.py"):
         python_docstrings.update(extract_docstrings_from_python(py_file))
 
     # Extract math references from Quarto docs
-    qmd_files = glob.glob("quarto/concepts/*.qmd")
+    qmd_files = Path("quarto/concepts").glob("*.qmd")
     qmd_math_references = {}
     for qmd_file in qmd_files:
-        with open(qmd_file, "r") as f:
-            content = f.read()
-
         # Look for definition references
-        pattern = r":::\s*\.callout-note\s*## Definition \d+: (.*?)\s+"
-        matches = re.findall(pattern, content, re.DOTALL)
-        for match in matches:
-            def_name = match.strip()
+        for def_name in scan_qmd(qmd_file).definition_refs:
             qmd_math_references[f"definition:{def_name}"] = qmd_file
 
     # Check for definitions in LaTeX not referenced in QMD
@@ -175,41 +337,51 @@ def check_math_consistency():
     return issues
 
 
-def check_cross_references():
-    """Check for broken links and cross-references."""
-    print("Checking cross-references...")
-
+def _link_issues(file_path, qmd_paths):
+    """Return the broken .qmd links in a single Quarto document."""
     issues = []
 
-    # Get all existing files
-    qmd_files = [
-        os.path.normpath(f) for f in glob.glob("quarto/**/*.qmd", recursive=True)
-    ]
-    qmd_files = [f.replace("\\", "/") for f in qmd_files]  # Normalize paths
+    # Resolve the document's directory once; each link is then normalized
+    # lexically instead of hitting the filesystem again in Path.resolve()
+    base_dir = file_path.parent.resolve()
 
-    # Check links in QMD files
-    for file_path in qmd_files:
-        with open(file_path, "r") as f:
-            content = f.read()
+    for target in scan_qmd(file_path).links:
+        target_file = f"{target}.qmd"
 
-        # Find all links
-        link_pattern = r"\[.*?\]\((.*?)\.qmd\)"
-        matches = re.findall(link_pattern, content)
+        # Make relative links absolute for checking
+        if not target.startswith("/"):
+            target_file = os.path.join(base_dir, target_file)
 
-        for match in matches:
-            target = match.strip()
-            target_file = f"{target}.qmd"
+        if Path(os.path.normpath(target_file)) not in qmd_paths:
+            issues.append(f"Broken link in {file_path}: {target}.qmd")
 
-            # Make relative links absolute for checking
-            if not target.startswith("/"):
-                base_dir = os.path.dirname(file_path)
-                target_file = os.path.normpath(os.path.join(base_dir, target_file))
-                target_file = target_file.replace("\\", "/")  # Normalize path
+    return issues
 
-            if target_file not in qmd_files:
-                issues.append(f"Broken link in {file_path}: {target}.qmd")
 
-    return issues
+def check_cross_references(qmd_files=None):
+    """Check for broken links and cross-references."""
+    print("Checking cross-references...")
+
+    # Get all existing files
+    if qmd_files is None:
+        qmd_files = list(find_qmd_files())
+    qmd_paths = {path.resolve() for path in qmd_files}
+
+    # Check links in QMD files
+    return map_files(functools.partial(_link_issues, qmd_paths=qmd_paths), qmd_files)
+
+
+def load_api_docs(api_dir="quarto/docs/api"):
+    """Map each API .qmd filename to its contents with a single directory scan."""
+    try:
+        with os.scandir(api_dir) as entries:
+            return {
+                entry.name: read_text(entry.path)
+                for entry in entries
+                if entry.name.endswith(".qmd") and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
 
 
 def check_documentation_coverage():
@@ -217,33 +389,33 @@ def check_documentation_coverage():
     print("Checking documentation coverage...")
 
     issues = []
+    api_docs = load_api_docs()
 
     # Get all Python modules
-    py_files = glob.glob("src/python/*.py")
+    py_files = Path("src/python").glob("*.py")
 
     for py_file in py_files:
-        module_name = os.path.basename(py_file).replace(".py", "")
+        module_name = py_file.stem
 
         # Check if module has corresponding documentation
-        qmd_file = f"quarto/docs/api/{module_name}.qmd"
-        if not os.path.exists(qmd_file):
+        qmd_name = f"{module_name}.qmd"
+        qmd_file = f"quarto/docs/api/{qmd_name}"
+        doc_content = api_docs.get(qmd_name)
+        if doc_content is None:
             issues.append(f"Missing API documentation for module {module_name}")
+            continue
 
         # Extract classes from Python file
-        with open(py_file, "r") as f:
-            content = f.read()
+        tree = ast.parse(read_text(py_file), filename=py_file)
 
-        class_pattern = r"class\s+(\w+)"
-        classes = re.findall(class_pattern, content)
+        classes = [
+            node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
+        ]
 
         for class_name in classes:
             # Check if class is mentioned in documentation
-            if os.path.exists(qmd_file):
-                with open(qmd_file, "r") as f:
-                    doc_content = f.read()
-
-                if class_name not in doc_content:
-                    issues.append(f"Class {class_name} not documented in {qmd_file}")
+            if class_name not in doc_content:
+                issues.append(f"Class {class_name} not documented in {qmd_file}")
 
     return issues
 
@@ -253,7 +425,7 @@ def generate_concept_index():
     print("Generating concept index...")
 
     # Get all concept documents
-    concept_files = glob.glob("quarto/concepts/*.qmd")
+    concept_files = Path("quarto/concepts").glob("*.qmd")
 
     # Extract metadata
     concepts = []
@@ -265,7 +437,7 @@ def generate_concept_index():
                     "title": metadata["title"],
                     "description": metadata.get("description", ""),
                     "status": metadata.get("status", "Unknown"),
-                    "path": os.path.basename(file_path),
+                    "path": file_path.name,
                     "tags": metadata.get("tags", []),
                 }
             )
@@ -273,54 +445,54 @@ def generate_concept_index():
     # Sort by title
     concepts.sort(key=lambda x: x["title"])
 
-    # Create index document
+    # Create index document, assembled in memory and written in one call
     output_path = "quarto/concepts/index.qmd"
 
-    with open(output_path, "w") as f:
-        f.write("---\n")
-        f.write('title: "Core Concepts"\n')
-        f.write('description: "Foundational concepts of the Timekeeper framework"\n')
-        f.write('date: "2025-03-28"\n')
-        f.write("categories: [Concept]\n")
-        f.write('status: "Stable"\n')
-        f.write("---\n\n")
-
-        f.write("# Core Concepts of the Timekeeper Framework\n\n")
-        f.write(
-            "This section outlines the core theoretical concepts that form the foundation of the Timekeeper framework.\n\n"
+    parts = [
+        "---\n",
+        'title: "Core Concepts"\n',
+        'description: "Foundational concepts of the Timekeeper framework"\n',
+        'date: "2025-03-28"\n',
+        "categories: [Concept]\n",
+        'status: "Stable"\n',
+        "---\n\n",
+        "# Core Concepts of the Timekeeper Framework\n\n",
+        "This section outlines the core theoretical concepts that form the foundation of the Timekeeper framework.\n\n",
+        "## Concept Map\n\n",
+        "```mermaid\n",
+        "graph TD\n",
+    ]
+
+    # Add nodes
+    for i, concept in enumerate(concepts):
+        parts.append(f'  C{i}["{concept["title"]}"]\n')
+
+    # Add simple relationships based on tags: index concepts by tag once,
+    # then connect every pair sharing a tag (in one direction only)
+    tag_to_concepts = defaultdict(list)
+    for i, concept in enumerate(concepts):
+        for tag in set(concept.get("tags", [])):
+            tag_to_concepts[tag].append(i)
+
+    edges = set()
+    for ids in tag_to_concepts.values():
+        edges.update(itertools.combinations(ids, 2))
+
+    for i, j in sorted(edges):
+        parts.append(f"  C{i} --> C{j}\n")
+
+    parts.append("```\n\n")
+    parts.append("## Overview of Concepts\n\n")
+
+    # Write concept list
+    for concept in concepts:
+        parts.append(f"### [{concept['title']}]({concept['path']})\n\n")
+        parts.append(f"{concept['description']}\n\n")
+        parts.append(
+            f'<span class="status-{concept["status"].lower()}">{concept["status"]}</span>\n\n'
         )
 
-        f.write("## Concept Map\n\n")
-        f.write("```mermaid\n")
-        f.write("graph TD\n")
-
-        # Add nodes
-        for i, concept in enumerate(concepts):
-            f.write(f'  C{i}["{concept["title"]}"]\n')
-
-        # Add simple relationships based on tags
-        for i, concept_i in enumerate(concepts):
-            for j, concept_j in enumerate(concepts):
-                if i != j:
-                    # Look for overlapping tags
-                    common_tags = set(concept_i.get("tags", [])) & set(
-                        concept_j.get("tags", [])
-                    )
-                    if common_tags and j > i:  # Only connect in one direction
-                        tag = next(iter(common_tags))
-                        f.write(f"  C{i} --> C{j}\n")
-
-        f.write("```\n\n")
-
-        f.write("## Overview of Concepts\n\n")
-
-        # Write concept list
-        for concept in concepts:
-            f.write(f"### [{concept['title']}]({concept['path']})\n\n")
-            f.write(f"{concept['description']}\n\n")
-            f.write(
-                f'<span class="status-{concept["status"].lower()}">{concept["status"]}</span>\n\n'
-            )
+    Path(output_path).write_text("".join(parts))
 
     print(f"Generated concept index at {output_path}")
 
@@ -376,11 +548,17 @@ def main():
     args = parser.parse_args()
 
     # Collect all issues
+    # Share one directory scan (and the cached file reads) across all checks
+    qmd_files = list(find_qmd_files())
+
     all_issues = []
-    all_issues.extend(check_metadata_consistency())
-    all_issues.extend(check_math_consistency())
-    all_issues.extend(check_cross_references())
-    all_issues.extend(check_documentation_coverage())
+    try:
+        all_issues.extend(check_metadata_consistency(qmd_files))
+        all_issues.extend(check_math_consistency())
+        all_issues.extend(check_cross_references(qmd_files))
+        all_issues.extend(check_documentation_coverage())
+    finally:
+        save_caches()
 
     # Report issues
     if all_issues:
@@ -1,10 +1,13 @@
+import itertools
 import os
-from google.cloud import aiplatform
 
 # Configuration (replace with your actual project details)
 PROJECT_ID = "timekeeper-455221"
 LOCATION = "us-central1"  # e.g., us-central1
 
+# Number of endpoints to list; also used as the server-side page size
+MAX_ENDPOINTS = 5
+
 
 def test_vertex_connection():
     """
@@ -15,24 +18,36 @@ def test_vertex_connection():
         f"Attempting to connect to Vertex AI project: {PROJECT_ID} in location: {LOCATION}"
     )
     try:
+        # Imported here: the SDK is slow to load and only needed for the call
+        from google.cloud import aiplatform
+
         # Initialize the Vertex AI client.
         # ADC should automatically find the credentials configured earlier
         # via 'gcloud auth application-default login'.
         aiplatform.init(project=PROJECT_ID, location=LOCATION)
         print("Vertex AI client initialized successfully.")
 
-        # List endpoints as a simple test call
+        # List endpoints as a simple test call.
+        # Endpoint.list() pages through every endpoint before returning, so go
+        # through the GAPIC client and ask the server for a single short page.
         print("\nListing first few Vertex AI Endpoints:")
-        endpoints = aiplatform.Endpoint.list(order_by="create_time desc")
+        client = aiplatform.gapic.EndpointServiceClient(
+            client_options={"api_endpoint": f"{LOCATION}-aiplatform.googleapis.com"}
+        )
+        request = aiplatform.gapic.ListEndpointsRequest(
+            parent=f"projects/{PROJECT_ID}/locations/{LOCATION}",
+            order_by="create_time desc",
+            page_size=MAX_ENDPOINTS,
+        )
+        endpoints = client.list_endpoints(request=request)
 
         count = 0
-        for endpoint in endpoints:
+        for endpoint in itertools.islice(endpoints, MAX_ENDPOINTS):
+            endpoint_id = endpoint.name.rsplit("/", 1)[-1]
             print(
-                f"- Endpoint ID: {endpoint.name}, Display Name: {endpoint.display_name}"
+                f"- Endpoint ID: {endpoint_id}, Display Name: {endpoint.display_name}"
             )
             count += 1
-            if count >= 5:  # List only the first 5 for brevity
-                break
 
         if count == 0:
             print("No endpoints found in this project/location.")
@@ -5,9 +5,144 @@ This module implements the concept of a Temporal Universe (Definition 1)
 from the formal mathematical theory of hierarchical temporal partitions.
 """
 
-from typing import List, Tuple, Dict, Optional, Any
+from typing import List, Tuple, Dict, Optional, Any, Callable
+import functools
 import math
 
+import numpy as np
+
+
+def _power_of_two_shifts(factors: List[int]) -> List[int]:
+    """
+    Map each factor to log2(factor) if it is a power of two, else to 0.
+
+    Dividing by a power of two is a right shift and the remainder a mask,
+    which is cheaper than divmod; a shift of 0 selects divmod.
+    """
+    return [k.bit_length() - 1 if k & (k - 1) == 0 else 0 for k in factors]
+
+
+def _divide(
+    quotient: str, remainder: str, value: str, divisor: int, use_shift: bool = True
+) -> str:
+    """Emit one line of source dividing value by a constant divisor."""
+    if use_shift and divisor & (divisor - 1) == 0:
+        shift = divisor.bit_length() - 1
+        return (
+            f"    {quotient}, {remainder} = ({value}) >> {shift}, "
+            f"({value}) & {divisor - 1}"
+        )
+    return f"    {quotient}, {remainder} = divmod({value}, {divisor})"
+
+
+_KERNEL_SIGNATURES = {
+    "normalize": "tp",
+    "add": "tp, duration",
+    "add_finest": "tp, value",
+    "to_absolute": "tp",
+    "from_absolute": "value",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_kernels(
+    units: Tuple[str, ...], subdivisions: Tuple[int, ...], weights: Tuple[int, ...]
+) -> Dict[str, Callable]:
+    """
+    Generate straight-line conversion functions for one fixed hierarchy.
+
+    The unit names, subdivision factors and cumulative factors are inlined
+    as constants, so the generated functions have no loops, no list
+    indexing and no per-call lookups of the hierarchy. Power-of-two
+    divisors are emitted as shifts and masks; shifts only accept integers,
+    so those functions fall back to a divmod version on a TypeError (e.g.
+    for float components).
+
+    Results are cached per hierarchy: the functions are pure, so universes
+    with the same structure share them and only the first one pays for
+    generating and compiling the source.
+
+    Args:
+        units: Unit names from coarsest to finest
+        subdivisions: Subdivision factors between adjacent units
+        weights: Size of each unit in finest units
+
+    Returns:
+        A mapping with the generated functions:
+            - "normalize": timepoint dict -> canonical timepoint dict
+            - "add": (timepoint dict, duration dict) -> canonical timepoint dict
+            - "add_finest": (timepoint dict, amount of the finest unit)
+              -> canonical timepoint dict
+            - "to_absolute": timepoint dict -> absolute value
+            - "from_absolute": non-negative absolute value -> canonical timepoint dict
+    """
+    shifted = _generate_kernels(units, subdivisions, weights, use_shift=True)
+    plain = _generate_kernels(units, subdivisions, weights, use_shift=False)
+
+    source = []
+    for name, args in _KERNEL_SIGNATURES.items():
+        if shifted[name] == plain[name]:
+            source.append(f"def {name}({args}):")
+            source += plain[name]
+        else:
+            source.append(f"def {name}_divmod({args}):")
+            source += plain[name]
+            source.append(f"def {name}({args}):")
+            source.append("    try:")
+            source += ["    " + line for line in shifted[name]]
+            source.append("    except TypeError:")
+            source.append(f"        return {name}_divmod({args})")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(source), namespace)
+    return {name: namespace[name] for name in _KERNEL_SIGNATURES}
+
+
+def _generate_kernels(
+    units: Tuple[str, ...],
+    subdivisions: Tuple[int, ...],
+    weights: Tuple[int, ...],
+    use_shift: bool,
+) -> Dict[str, List[str]]:
+    """Source lines of each function body for _compile_kernels."""
+    n = len(units)
+    keys = [repr(unit) for unit in units]
+    result = "    return {" + ", ".join(f"{keys[i]}: c{i}" for i in range(n)) + "}"
+
+    def carry_lines(read: Callable[[int], str]) -> List[str]:
+        lines = [f"    carry = {read(n - 1)}"]
+        for i in range(n - 1, 0, -1):
+            lines.append(
+                _divide("carry", f"c{i}", "carry", subdivisions[i - 1], use_shift)
+            )
+            lines.append(f"    carry += {read(i - 1)}")
+        lines.append("    c0 = carry")
+        return lines
+
+    bodies = {}
+    bodies["normalize"] = carry_lines(lambda i: f"tp.get({keys[i]}, 0)")
+    bodies["add"] = carry_lines(
+        lambda i: f"tp.get({keys[i]}, 0) + duration.get({keys[i]}, 0)"
+    )
+    bodies["add_finest"] = carry_lines(
+        lambda i: f"tp.get({keys[i]}, 0)" + (" + value" if i == n - 1 else "")
+    )
+    for body in bodies.values():
+        body.append(result)
+
+    terms = [f"tp.get({keys[i]}, 0) * {weights[i]}" for i in range(n - 1)]
+    terms.append(f"tp.get({keys[n - 1]}, 0)")
+    bodies["to_absolute"] = [f"    return {' + '.join(terms)}"]
+
+    # The remainder is a new local so that the divmod fallback still sees
+    # the argument
+    lines = ["    r = value"]
+    lines += [_divide(f"c{i}", "r", "r", weights[i], use_shift) for i in range(n - 1)]
+    lines.append(f"    c{n - 1} = r")
+    lines.append(result)
+    bodies["from_absolute"] = lines
+    return bodies
+
 
 class TemporalUniverse:
     """
@@ -29,6 +164,22 @@ class TemporalUniverse:
         - Axiom 1: Time Linearity (implemented by the ordering)
     """
 
+    # Fixed attribute set: slot access is cheaper than an instance __dict__
+    # and universes are created freely (e.g. one per agent)
+    __slots__ = (
+        "units",
+        "subdivisions",
+        "cumulative_factors",
+        "_unit_index",
+        "_shifts",
+        "_normalize",
+        "_add",
+        "_add_finest",
+        "_to_absolute",
+        "_from_absolute",
+        "_cum_np",
+    )
+
     def __init__(self, units: List[str], subdivisions: List[int]):
         """
         Initialize a temporal universe with hierarchical units.
@@ -62,12 +213,33 @@ class TemporalUniverse:
         self.subdivisions = subdivisions
         self._unit_index = {unit: i for i, unit in enumerate(units)}
 
-        # Calculate cumulative subdivision factors for each level
-        self.cumulative_factors = [1]
-        factor = 1
-        for s in reversed(subdivisions):
-            factor *= s
-            self.cumulative_factors.insert(0, factor)
+        # Calculate cumulative subdivision factors for each level:
+        # cumulative_factors[i] is the size of one units[i] in finest units
+        factors = [1] * len(units)
+        for i in range(len(subdivisions) - 1, -1, -1):
+            factors[i] = factors[i + 1] * subdivisions[i]
+        self.cumulative_factors = factors
+
+        # Power-of-two factors are divided by shifting (see _power_of_two_shifts)
+        self._shifts = _power_of_two_shifts(subdivisions)
+
+        # The hierarchy is fixed, so the conversions are generated once with
+        # every unit name and factor inlined
+        kernels = _compile_kernels(
+            tuple(units), tuple(subdivisions), tuple(self.cumulative_factors)
+        )
+        self._normalize = kernels["normalize"]
+        self._add = kernels["add"]
+        self._add_finest = kernels["add_finest"]
+        self._to_absolute = kernels["to_absolute"]
+        self._from_absolute = kernels["from_absolute"]
+
+        # int64 copy for the batch methods, which work on (N, n_units) arrays
+        self._cum_np = np.asarray(self.cumulative_factors, dtype=np.int64)
+
+    def _to_dict(self, components: List[int]) -> Dict[str, int]:
+        """Pack a list of components back into a timepoint dictionary."""
+        return dict(zip(self.units, components))
 
     def create_timepoint(self, **components) -> Dict[str, int]:
         """
@@ -87,17 +259,13 @@ class TemporalUniverse:
             This method creates a timepoint as defined in Definition 6 (Timepoint),
             ensuring it adheres to the canonical form specified in Definition 7.
         """
-        # Start with zeros for all units
-        result = {unit: 0 for unit in self.units}
-
-        # Update with provided components
-        for unit, value in components.items():
-            if unit not in self._unit_index:
+        unit_index = self._unit_index
+        for unit in components:
+            if unit not in unit_index:
                 raise ValueError(f"Unknown temporal unit: {unit}")
-            result[unit] = value
 
         # Normalize to canonical form (Definition 7)
-        return self.normalize_timepoint(result)
+        return self._normalize(components)
 
     def normalize_timepoint(self, timepoint: Dict[str, int]) -> Dict[str, int]:
         """
@@ -116,25 +284,7 @@ class TemporalUniverse:
             - Definition 7: Canonical Timepoint Representation
             - Used in: Axiom 2 (Temporal Addition), Axiom 3 (Temporal Subtraction)
         """
-        result = timepoint.copy()
-        carry = 0
-
-        # Process from finest unit to coarsest, applying normalization
-        for i in range(len(self.units) - 1, 0, -1):
-            current_unit = self.units[i]
-            next_coarser_unit = self.units[i - 1]
-            subdivision = self.subdivisions[i - 1]
-
-            # Add any carry from finer units
-            result[current_unit] += carry
-
-            # Calculate new carry and normalized value
-            carry, result[current_unit] = divmod(result[current_unit], subdivision)
-
-        # Handle the coarsest unit
-        result[self.units[0]] += carry
-
-        return result
+        return self._normalize(timepoint)
 
     def compare_timepoints(self, t1: Dict[str, int], t2: Dict[str, int]) -> int:
         """
@@ -151,19 +301,11 @@ class TemporalUniverse:
             This method implements the strict total ordering (<) defined in
             Definition 1 (Temporal Universe), and follows Axiom 1 (Time Linearity).
         """
-        # Normalize both timepoints to ensure canonical form
-        t1_normalized = self.normalize_timepoint(t1)
-        t2_normalized = self.normalize_timepoint(t2)
-
-        # Compare from coarsest to finest
-        for unit in self.units:
-            if t1_normalized[unit] < t2_normalized[unit]:
-                return -1
-            elif t1_normalized[unit] > t2_normalized[unit]:
-                return 1
-
-        # All components are equal
-        return 0
+        # Absolute values order timepoints (Theorem 1) and need no
+        # normalization, so this is two weighted sums and one comparison
+        a = self._to_absolute(t1)
+        b = self._to_absolute(t2)
+        return (a > b) - (a < b)
 
     def timepoint_to_absolute(self, timepoint: Dict[str, int]) -> int:
         """
@@ -179,13 +321,9 @@ class TemporalUniverse:
             This method implements the bijection between hierarchical timepoints and
             linear timepoints described in Theorem 1 (Hierarchical-Linear Equivalence).
         """
-        normalized = self.normalize_timepoint(timepoint)
-        absolute = 0
-
-        for i, unit in enumerate(self.units):
-            absolute += normalized[unit] * self.cumulative_factors[i + 1]
-
-        return absolute
+        # The weighted sum is the same for every representation of a
+        # timepoint, so no normalization is needed first
+        return self._to_absolute(timepoint)
 
     def absolute_to_timepoint(self, absolute_value: int) -> Dict[str, int]:
         """
@@ -204,18 +342,7 @@ class TemporalUniverse:
         if absolute_value < 0:
             raise ValueError("Absolute time value cannot be negative")
 
-        timepoint = {}
-        remaining = absolute_value
-
-        # Convert from coarsest to finest
-        for i, unit in enumerate(self.units[:-1]):
-            divisor = self.cumulative_factors[i + 1]
-            timepoint[unit], remaining = divmod(remaining, divisor)
-
-        # Handle the finest unit
-        timepoint[self.units[-1]] = remaining
-
-        return timepoint
+        return self._from_absolute(absolute_value)
 
     def add_duration(
         self, timepoint: Dict[str, int], duration: Dict[str, int]
@@ -233,13 +360,14 @@ class TemporalUniverse:
         Theoretical Foundation:
             This method implements Axiom 2 (Temporal Addition) from the formal theory.
         """
-        result = timepoint.copy()
-
-        for unit, value in duration.items():
-            if unit in result:
-                result[unit] += value
+        # Durations given purely in the finest unit (e.g. a step count) need
+        # no lookups for the other units
+        finest = self.units[-1]
+        if len(duration) == 1 and finest in duration:
+            return self._add_finest(timepoint, duration[finest])
 
-        return self.normalize_timepoint(result)
+        # Units the universe does not know are ignored
+        return self._add(timepoint, duration)
 
     def subtract_timepoints(
         self, t2: Dict[str, int], t1: Dict[str, int]
@@ -260,11 +388,230 @@ class TemporalUniverse:
         Theoretical Foundation:
             This method implements Axiom 3 (Temporal Subtraction) from the formal theory.
         """
-        if self.compare_timepoints(t2, t1) < 0:
-            raise ValueError("Cannot subtract a later timepoint from an earlier one")
-
-        # Convert to absolute values, subtract, then convert back
+        # Convert to absolute values, subtract, then convert back; the
+        # absolute values also order the timepoints
         abs1 = self.timepoint_to_absolute(t1)
         abs2 = self.timepoint_to_absolute(t2)
 
+        if abs2 < abs1:
+            raise ValueError("Cannot subtract a later timepoint from an earlier one")
+
         return self.absolute_to_timepoint(abs2 - abs1)
+
+    def timepoints_to_array(self, timepoints: List[Dict[str, int]]) -> np.ndarray:
+        """
+        Pack timepoint dictionaries into an (N, n_units) int64 array.
+
+        Args:
+            timepoints: A sequence of timepoint dictionaries
+
+        Returns:
+            An array with one row per timepoint and one column per unit,
+            ordered from coarsest to finest; missing units are zero
+        """
+        units = self.units
+        arr = np.zeros((len(timepoints), len(units)), dtype=np.int64)
+        for row, timepoint in zip(arr, timepoints):
+            row[:] = [timepoint.get(unit, 0) for unit in units]
+        return arr
+
+    def array_to_timepoints(self, arr: np.ndarray) -> List[Dict[str, int]]:
+        """
+        Unpack an (N, n_units) array into timepoint dictionaries.
+
+        Args:
+            arr: An array as produced by timepoints_to_array or the batch methods
+
+        Returns:
+            A list of timepoint dictionaries, one per row
+        """
+        return [self._to_dict(row) for row in np.asarray(arr).tolist()]
+
+    def normalize_batch(self, timepoints: np.ndarray) -> np.ndarray:
+        """
+        Normalize many timepoints at once.
+
+        Vectorized form of normalize_timepoint: the carry is propagated over
+        the short unit axis while each step works on the whole batch.
+
+        Args:
+            timepoints: An (N, n_units) integer array, one timepoint per row
+
+        Returns:
+            A new (N, n_units) int64 array in canonical form
+
+        References:
+            - Definition 7: Canonical Timepoint Representation
+        """
+        return self._normalize_rows(np.array(timepoints, dtype=np.int64))
+
+    def _normalize_rows(self, result: np.ndarray) -> np.ndarray:
+        """
+        Normalize an (N, n_units) int64 array in place and return it.
+
+        Every step writes into the array itself or into a single carry
+        buffer, so no temporaries are allocated per unit.
+        """
+        carry = np.zeros(len(result), dtype=np.int64)
+
+        subdivisions = self.subdivisions
+        shifts = self._shifts
+
+        for i in range(len(subdivisions), 0, -1):
+            column = result[:, i]
+            column += carry
+            shift = shifts[i - 1]
+            if shift:
+                np.right_shift(column, shift, out=carry)
+                column &= subdivisions[i - 1] - 1
+            else:
+                np.divmod(column, subdivisions[i - 1], out=(carry, column))
+
+        result[:, 0] += carry
+        return result
+
+    def add_duration_batch(
+        self, timepoints: np.ndarray, duration: Dict[str, int]
+    ) -> np.ndarray:
+        """
+        Add the same duration to many timepoints at once.
+
+        Args:
+            timepoints: An (N, n_units) integer array, one timepoint per row
+            duration: The duration to add to every row
+
+        Returns:
+            A new (N, n_units) int64 array in canonical form
+
+        Theoretical Foundation:
+            Vectorized form of Axiom 2 (Temporal Addition).
+        """
+        unit_index = self._unit_index
+        offset = np.zeros(len(unit_index), dtype=np.int64)
+        for unit, value in duration.items():
+            i = unit_index.get(unit)
+            if i is not None:
+                offset[i] += value
+
+        # The sum is a fresh array, so it can be normalized in place
+        return self._normalize_rows(np.asarray(timepoints, dtype=np.int64) + offset)
+
+    def absolute_batch(self, timepoints: np.ndarray) -> np.ndarray:
+        """
+        Convert many timepoints to absolute values at once.
+
+        Args:
+            timepoints: An (N, n_units) integer array, one timepoint per row
+
+        Returns:
+            An (N,) int64 array of absolute values in finest units
+
+        Theoretical Foundation:
+            Vectorized form of Theorem 1 (Hierarchical-Linear Equivalence).
+        """
+        return np.asarray(timepoints, dtype=np.int64) @ self._cum_np
+
+    def compare_batch(self, t1: np.ndarray, t2: np.ndarray) -> np.ndarray:
+        """
+        Compare two batches of timepoints row by row.
+
+        The rows need not be normalized: the difference of the absolute
+        values orders them, as in compare_timepoints.
+
+        Args:
+            t1: An (N, n_units) integer array of first timepoints
+            t2: An (N, n_units) integer array of second timepoints, or a
+                single (n_units,) timepoint to compare every row against
+
+        Returns:
+            An (N,) int8 array holding -1, 0 or 1 for each row
+
+        Theoretical Foundation:
+            Vectorized form of the ordering in Axiom 1 (Time Linearity).
+        """
+        difference = np.asarray(t1, dtype=np.int64) - np.asarray(t2, dtype=np.int64)
+        return np.sign(difference @ self._cum_np).astype(np.int8)
+
+    def argsort_batch(self, timepoints: np.ndarray) -> np.ndarray:
+        """
+        Order many timepoints chronologically.
+
+        Sorts once on the absolute values instead of comparing pairs of
+        timepoints; ties keep their original order.
+
+        Args:
+            timepoints: An (N, n_units) integer array, one timepoint per row
+
+        Returns:
+            An (N,) array of row indices that sorts the timepoints, earliest first
+
+        Theoretical Foundation:
+            Relies on Axiom 1 (Time Linearity): the order is total, so sorting
+            the absolute values sorts the timepoints.
+        """
+        return np.argsort(self.absolute_batch(timepoints), kind="stable")
+
+    def pack(self, timepoint: Dict[str, int]) -> int:
+        """
+        Encode a timepoint as a single integer for compact storage.
+
+        The encoding is the absolute value in finest units, so packed
+        timepoints compare and subtract as plain integers.
+
+        Args:
+            timepoint: A timepoint dictionary
+
+        Returns:
+            The packed timepoint
+        """
+        return self._to_absolute(timepoint)
+
+    def unpack(self, value: int) -> Dict[str, int]:
+        """
+        Decode a packed timepoint.
+
+        Args:
+            value: A value produced by pack
+
+        Returns:
+            A timepoint dictionary in canonical form
+        """
+        return self.absolute_to_timepoint(value)
+
+    def pack_many(
+        self, timepoints: List[Dict[str, int]], dtype: Any = np.int64
+    ) -> np.ndarray:
+        """
+        Encode many timepoints into one integer array.
+
+        One int64 per timepoint replaces a dictionary of boxed integers,
+        which matters for logs and replay buffers holding many timepoints.
+        Pass dtype=np.int32 to halve that again when every absolute value
+        fits in 32 bits; a value that does not fit raises OverflowError.
+
+        Args:
+            timepoints: A sequence of timepoint dictionaries
+            dtype: Integer dtype of the result (default: np.int64)
+
+        Returns:
+            An (N,) array of packed timepoints
+        """
+        to_absolute = self._to_absolute
+        return np.fromiter(
+            (to_absolute(timepoint) for timepoint in timepoints),
+            dtype=dtype,
+            count=len(timepoints),
+        )
+
+    def unpack_many(self, values: np.ndarray) -> List[Dict[str, int]]:
+        """
+        Decode an array of packed timepoints.
+
+        Args:
+            values: An array or sequence of values produced by pack or pack_many
+
+        Returns:
+            A list of timepoint dictionaries in canonical form
+        """
+        unpack = self.absolute_to_timepoint
+        return [unpack(value) for value in np.asarray(values).tolist()]
@@ -5,9 +5,65 @@ This module extends the core AgentTemporal class with adaptability features
 that allow the system to adjust its temporal units based on observed usage patterns.
 """
 
+import functools
+import types
 from collections import defaultdict
+from contextlib import contextmanager
+from enum import IntEnum
+
+import numpy as np
+
 from .agent_temporal import AgentTemporal
 
+
+class Op(IntEnum):
+    """
+    Operation types tracked by AdaptiveAgentTemporal.
+
+    Each value is a row of the operation counter matrix; the lowercase
+    name ("add", "compare", ...) is the key used in ``operations``.
+    """
+
+    ADD = 0
+    SUBTRACT = 1
+    COMPARE = 2
+    TO_HUMAN = 3
+    FROM_HUMAN = 4
+
+
+def _tracked(op, method):
+    """
+    Wrap an AgentTemporal method so that each call is counted as op.
+    
+    The wrapper still checks tracking_enabled, for calls that reach it
+    through a subclass override while tracking is disabled.
+    
+    Args:
+        op: The Op to record after a successful call
+        method: The untracked AgentTemporal method
+    """
+    @functools.wraps(method)
+    def tracked(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        if self._tracking_enabled:
+            self.track_operation(op)
+        return result
+    
+    tracked.untracked = method
+    return tracked
+
+
+# How many (unit count, agent count) pairs each instance remembers ranges for
+_RANGES_CACHE_SIZE = 32
+
+
+def _remember(cache, key, value):
+    """Store value in a bounded cache, evicting the oldest entry when full."""
+    if len(cache) >= _RANGES_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
 class AdaptiveAgentTemporal(AgentTemporal):
     """
     Extension of AgentTemporal that implements dynamic adaptability as described
@@ -18,26 +74,72 @@ class AdaptiveAgentTemporal(AgentTemporal):
     - Optimal Temporal Granularity (Property 1)
     """
     
-    def __init__(self, unit_config=None, agent_count=1):
+    def __init__(self, unit_config=None, agent_count=1, tracking_enabled=True):
         """
         Initialize the adaptive temporal system.
         
         Args:
             unit_config: Optional custom configuration of time units
             agent_count: Number of agents in the system (default: 1)
+            tracking_enabled: Whether operations are tracked for adaptation
+                (default: True); see the tracking_enabled property
         """
         super().__init__(unit_config)
         
         # Track the number of agents
         self.agent_count = agent_count
         
-        # Operation tracking for adaptation
-        self.operations = defaultdict(int)
+        # Operation tracking for adaptation: one row per operation type and
+        # one column per unit in self.units, plus a total per operation type.
+        # Operation types other than Op get rows on first use.
+        self._op_rows = {op: op.value for op in Op}
+        self._op_rows.update((op.name.lower(), op.value) for op in Op)
+        self._op_labels = [op.name.lower() for op in Op]
+        self._op_totals = [0] * len(Op)
+        self._op_unit_counts = [[0] * len(self.units) for _ in Op]
+        # Per-unit counts for units outside the hierarchy (never added, or
+        # removed), keyed by (row, unit name); they move back into the matrix
+        # if the unit is added again
+        self._op_other_units = defaultdict(int)
         self.op_counter = 0
         self.adaptation_threshold = 100  # Adjust after 100 operations
         
+        # Optimal ranges for (unit count, agent count) pairs seen so far, so
+        # that adapting back and forth does not recompute them
+        self._ranges_cache = {}
+        
+        # Structural changes made inside batch_adjust() are applied on exit
+        self._batch_depth = 0
+        self._pending_conversions = False
+        self._pending_ranges = False
+        
         # Initialize optimal ranges based on agent count (Property 1)
-        self._initialize_optimal_ranges()
+        self._initialize_optimal_ranges_cached()
+        
+        self.tracking_enabled = tracking_enabled
+    
+    @property
+    def tracking_enabled(self):
+        """
+        Whether the tracked operations count towards adaptation.
+        
+        Disabling tracking binds the plain AgentTemporal methods on the
+        instance, so replays and benchmarks run without the tracking call;
+        enabling it again restores the tracked methods. Methods a subclass
+        overrides are left as they are.
+        """
+        return self._tracking_enabled
+    
+    @tracking_enabled.setter
+    def tracking_enabled(self, enabled):
+        self._tracking_enabled = bool(enabled)
+        for name in _TRACKED_METHODS:
+            if enabled:
+                self.__dict__.pop(name, None)
+            else:
+                untracked = getattr(getattr(type(self), name), "untracked", None)
+                if untracked is not None:
+                    setattr(self, name, untracked.__get__(self))
     
     def _initialize_optimal_ranges(self):
         """
@@ -49,28 +151,132 @@ class AdaptiveAgentTemporal(AgentTemporal):
         - A ≤ k_i ≤ 5A for coarser units (higher index)
         """
         n = len(self.units)
-        self.optimal_ranges = []
+        coarse = (self.agent_count, 5 * self.agent_count)
+        first_third = n / 3
+        second_third = 2 * n / 3
+        optimal_ranges = []
         
         # Set optimal ranges based on unit position in hierarchy
         for i in range(n):
-            if i < n/3:  # Coarser units (first third)
-                self.optimal_ranges.append((self.agent_count, 5 * self.agent_count))
-            elif i < 2*n/3:  # Intermediate units (middle third)
-                self.optimal_ranges.append((5, 24))
+            if i < first_third:  # Coarser units (first third)
+                optimal_ranges.append(coarse)
+            elif i < second_third:  # Intermediate units (middle third)
+                optimal_ranges.append((5, 24))
             else:  # Finer units (last third)
-                self.optimal_ranges.append((10, 100))
+                optimal_ranges.append((10, 100))
+        self.optimal_ranges = optimal_ranges
+    
+    def _initialize_optimal_ranges_cached(self):
+        """
+        Set optimal ranges, reusing the result for a known (unit count, agent count).
+        """
+        key = (len(self.units), self.agent_count)
+        ranges = self._ranges_cache.get(key)
+        if ranges is None:
+            self._initialize_optimal_ranges()
+            _remember(self._ranges_cache, key, self.optimal_ranges)
+        else:
+            self.optimal_ranges = list(ranges)
+    
+    def _structure_changed(self, ranges=False):
+        """
+        Refresh derived tables after a structural change, or defer it in a batch.
+        
+        Args:
+            ranges: Whether the number of units changed, which also affects
+                the optimal ranges
+        """
+        if self._batch_depth:
+            self._pending_conversions = True
+            self._pending_ranges = self._pending_ranges or ranges
+            return
+        
+        self._compute_conversions()
+        if ranges:
+            self._initialize_optimal_ranges_cached()
+    
+    @contextmanager
+    def batch_adjust(self):
+        """
+        Group several structural changes and refresh derived tables once.
+        
+        Inside the block, adjust_subdivision, add_time_unit and remove_time_unit
+        update the hierarchy immediately but defer recomputing conversion factors
+        and optimal ranges until the outermost block exits. Do not convert
+        timepoints inside the block.
+        
+        Example:
+            with adaptive.batch_adjust():
+                adaptive.adjust_subdivision("cycle", 30)
+                adaptive.adjust_subdivision("step", 500)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._pending_conversions:
+                    self._compute_conversions()
+                if self._pending_ranges:
+                    self._initialize_optimal_ranges_cached()
+                self._pending_conversions = False
+                self._pending_ranges = False
+    
+    @property
+    def operations(self):
+        """
+        Operation counts keyed by "op" and "op:unit".
+        
+        Per-unit counts are kept by unit name, so they survive the unit
+        being removed from the hierarchy. Record operations with
+        track_operation; the mapping itself is read-only.
+        
+        Returns:
+            A read-only view of a defaultdict(int) snapshot of the counts
+        """
+        operations = defaultdict(int)
+        for label, total, unit_counts in zip(
+            self._op_labels, self._op_totals, self._op_unit_counts
+        ):
+            if total:
+                operations[label] = total
+            for unit, count in zip(self.units, unit_counts):
+                if count:
+                    operations[f"{label}:{unit['name']}"] = count
+        for (row, unit_name), count in self._op_other_units.items():
+            operations[f"{self._op_labels[row]}:{unit_name}"] = count
+        return types.MappingProxyType(operations)
+    
+    def _add_op_row(self, op_type):
+        """Register a new operation type and return its counter row."""
+        row = len(self._op_labels)
+        self._op_rows[op_type] = row
+        self._op_labels.append(str(op_type))
+        self._op_totals.append(0)
+        self._op_unit_counts.append([0] * len(self.units))
+        return row
     
     def track_operation(self, op_type, unit_name=None):
         """
         Track operations to inform adaptive behavior.
         
         Args:
-            op_type: Type of operation ('add', 'subtract', 'compare', etc.)
-            unit_name: Specific unit the operation primarily involves, if applicable
+            op_type: Type of operation, an Op or its name ('add', 'subtract',
+                'compare', etc.); other names are counted under their own key
+            unit_name: Specific unit the operation primarily involves, if applicable.
+                Units outside the current hierarchy are counted too, by name.
         """
-        self.operations[op_type] += 1
+        row = self._op_rows.get(op_type)
+        if row is None:
+            row = self._add_op_row(op_type)
+        self._op_totals[row] += 1
         if unit_name:
-            self.operations[f"{op_type}:{unit_name}"] += 1
+            column = self.unit_indices.get(unit_name)
+            if column is not None:
+                self._op_unit_counts[row][column] += 1
+            else:
+                self._op_other_units[row, unit_name] += 1
             
         self.op_counter += 1
         
@@ -81,35 +287,66 @@ class AdaptiveAgentTemporal(AgentTemporal):
             # Reset counter but keep history
             self.op_counter = 0
     
+    def track_operation_batch(self, op_type, count, unit_name=None):
+        """
+        Track count operations of the same type at once.
+        
+        Equivalent to calling track_operation count times, except that the
+        counts are recorded before any adaptation check runs. The check still
+        runs once for every time the operation counter reaches the threshold.
+        
+        Args:
+            op_type: Type of operation, as for track_operation
+            count: Number of operations to record
+            unit_name: Specific unit the operations involve, if applicable
+        """
+        if count <= 0:
+            return
+        
+        row = self._op_rows.get(op_type)
+        if row is None:
+            row = self._add_op_row(op_type)
+        self._op_totals[row] += count
+        if unit_name:
+            column = self.unit_indices.get(unit_name)
+            if column is not None:
+                self._op_unit_counts[row][column] += count
+            else:
+                self._op_other_units[row, unit_name] += count
+        
+        checks, self.op_counter = divmod(
+            self.op_counter + count, self.adaptation_threshold
+        )
+        for _ in range(checks):
+            self._check_for_adjustment()
+    
     def _check_for_adjustment(self):
         """
         Analyze operation patterns and potentially adjust subdivision factors.
         
         This implements Γ(O, A) from Definition 21.
         """
-        # Build a usage profile for each unit
-        unit_usage = defaultdict(int)
-        for op_key, count in self.operations.items():
-            if ":" in op_key:
-                _, unit = op_key.split(":")
-                unit_usage[unit] += count
-        
-        # Determine if any unit is over/under utilized
-        total_ops = sum(unit_usage.values()) or 1  # Avoid division by zero
-        
-        # Check each unit for potential adjustment
+        # Build a usage profile for each unit: one column sum of the
+        # counter matrix, then each unit's share of all per-unit operations,
+        # including those on units outside the hierarchy
+        unit_usage = np.sum(self._op_unit_counts, axis=0)
+        total_ops = unit_usage.sum() + sum(self._op_other_units.values())
+        total_ops = total_ops or 1  # Avoid division by zero
+        usage_shares = (unit_usage / total_ops).tolist()
+        
+        # Check each unit for potential adjustment, by position
         adjustments = []
+        subdivisions = [unit["subdivisions"] for unit in self.units]
         
-        for i, unit in enumerate(self.units[:-1]):  # Skip base unit
-            unit_name = unit["name"]
-            usage_pct = unit_usage.get(unit_name, 0) / total_ops
+        for i in range(len(subdivisions) - 1):  # Skip base unit
+            usage_pct = usage_shares[i]
             
             # Skip units with very low usage
             if usage_pct < 0.05:
                 continue
                 
             # Get current subdivision
-            current_subdiv = unit["subdivisions"]
+            current_subdiv = subdivisions[i]
             # Get optimal range
             min_val, max_val = self.optimal_ranges[i]
             
@@ -132,10 +369,11 @@ class AdaptiveAgentTemporal(AgentTemporal):
                         adjustments.append((i, int(new_val)))
         
         # Apply adjustments
-        for idx, new_subdiv in adjustments:
-            unit_name = self.units[idx]["name"]
-            print(f"Adjusting subdivision factor for {unit_name} from {self.units[idx]['subdivisions']} to {new_subdiv}")
-            self.adjust_subdivision(unit_name, new_subdiv)
+        with self.batch_adjust():
+            for idx, new_subdiv in adjustments:
+                unit_name = self.units[idx]["name"]
+                print(f"Adjusting subdivision factor for {unit_name} from {subdivisions[idx]} to {new_subdiv}")
+                self._set_subdivision(idx, new_subdiv)
     
     def adjust_subdivision(self, unit_name, new_subdiv):
         """
@@ -156,11 +394,16 @@ class AdaptiveAgentTemporal(AgentTemporal):
         if idx == self.base_unit_index:
             raise ValueError("Cannot adjust subdivision factor of the base unit")
             
-        # Replace the subdivision factor
+        self._set_subdivision(idx, new_subdiv)
+    
+    def _set_subdivision(self, idx, new_subdiv):
+        """Replace the subdivision factor of the non-base unit at index idx."""
+        if self.units[idx]["subdivisions"] == new_subdiv:
+            return  # Nothing to recompute
         self.units[idx]["subdivisions"] = new_subdiv
         
         # Recompute conversion factors
-        self._compute_conversions()
+        self._structure_changed()
     
     def add_time_unit(self, name, subdivisions, after_unit=None, before_unit=None):
         """
@@ -195,19 +438,23 @@ class AdaptiveAgentTemporal(AgentTemporal):
         
         # Insert the new unit
         self.units.insert(position, new_unit)
+        other_units = self._op_other_units
+        for row, unit_counts in enumerate(self._op_unit_counts):
+            unit_counts.insert(position, other_units.pop((row, name), 0))
         
         # Update base unit index if needed
         if position <= self.base_unit_index:
             self.base_unit_index += 1
             
-        # Rebuild unit indices mapping
-        self.unit_indices = {u["name"]: i for i, u in enumerate(self.units)}
-        
-        # Recompute conversion factors
-        self._compute_conversions()
-        
-        # Update optimal ranges
-        self._initialize_optimal_ranges()
+        # Shift the indices of the units after the new one, then add it
+        unit_indices = self.unit_indices
+        for unit, i in unit_indices.items():
+            if i >= position:
+                unit_indices[unit] = i + 1
+        unit_indices[name] = position
+        
+        # Recompute conversion factors and optimal ranges
+        self._structure_changed(ranges=True)
     
     def remove_time_unit(self, unit_name):
         """
@@ -229,19 +476,25 @@ class AdaptiveAgentTemporal(AgentTemporal):
             
         # Remove the unit
         self.units.pop(idx)
+        other_units = self._op_other_units
+        for row, unit_counts in enumerate(self._op_unit_counts):
+            count = unit_counts.pop(idx)
+            if count:
+                other_units[row, unit_name] += count
         
         # Update base unit index if needed
         if idx < self.base_unit_index:
             self.base_unit_index -= 1
             
-        # Rebuild unit indices mapping
-        self.unit_indices = {u["name"]: i for i, u in enumerate(self.units)}
-        
-        # Recompute conversion factors
-        self._compute_conversions()
-        
-        # Update optimal ranges
-        self._initialize_optimal_ranges()
+        # Drop the unit and shift the indices of the units after it
+        unit_indices = self.unit_indices
+        del unit_indices[unit_name]
+        for unit, i in unit_indices.items():
+            if i > idx:
+                unit_indices[unit] = i - 1
+        
+        # Recompute conversion factors and optimal ranges
+        self._structure_changed(ranges=True)
     
     def optimize_for_agent_count(self, new_agent_count):
         """
@@ -259,50 +512,37 @@ class AdaptiveAgentTemporal(AgentTemporal):
         self.agent_count = new_agent_count
         
         # Update optimal ranges
-        self._initialize_optimal_ranges()
+        self._initialize_optimal_ranges_cached()
         
         # Adjust each unit's subdivision to match optimal ranges
-        for i, unit in enumerate(self.units[:-1]):  # Skip base unit
-            min_val, max_val = self.optimal_ranges[i]
-            current_subdiv = unit["subdivisions"]
-            
-            # If outside range, adjust to nearest boundary
-            if current_subdiv < min_val:
-                self.adjust_subdivision(unit["name"], min_val)
-            elif current_subdiv > max_val:
-                self.adjust_subdivision(unit["name"], max_val)
+        with self.batch_adjust():
+            for i in range(len(self.units) - 1):  # Skip base unit
+                min_val, max_val = self.optimal_ranges[i]
+                current_subdiv = self.units[i]["subdivisions"]
+                
+                # If outside range, adjust to nearest boundary
+                if current_subdiv < min_val:
+                    self._set_subdivision(i, min_val)
+                elif current_subdiv > max_val:
+                    self._set_subdivision(i, max_val)
     
     # Override core operations to track usage
     
-    def add_time(self, tp, **kwargs):
-        """Override to track operation"""
-        result = super().add_time(tp, **kwargs)
-        self.track_operation("add")
-        return result
-    
-    def subtract_time(self, tp, **kwargs):
-        """Override to track operation"""
-        result = super().subtract_time(tp, **kwargs)
-        self.track_operation("subtract")
-        return result
-    
-    def compare_timepoints(self, t1, t2):
-        """Override to track operation"""
-        result = super().compare_timepoints(t1, t2)
-        self.track_operation("compare")
-        return result
-    
-    def to_human_time(self, agent_tp):
-        """Override to track operation"""
-        result = super().to_human_time(agent_tp)
-        self.track_operation("to_human")
-        return result
-    
-    def from_human_time(self, human_dict):
-        """Override to track operation"""
-        result = super().from_human_time(human_dict)
-        self.track_operation("from_human")
-        return result
+    add_time = _tracked(Op.ADD, AgentTemporal.add_time)
+    subtract_time = _tracked(Op.SUBTRACT, AgentTemporal.subtract_time)
+    compare_timepoints = _tracked(Op.COMPARE, AgentTemporal.compare_timepoints)
+    to_human_time = _tracked(Op.TO_HUMAN, AgentTemporal.to_human_time)
+    from_human_time = _tracked(Op.FROM_HUMAN, AgentTemporal.from_human_time)
+
+
+# Methods replaced by their untracked versions when tracking is disabled
+_TRACKED_METHODS = (
+    "add_time",
+    "subtract_time",
+    "compare_timepoints",
+    "to_human_time",
+    "from_human_time",
+)
 
 
 """
@@ -6,6 +6,215 @@ the theoretical framework, including temporal universe, hierarchical partitions,
 timepoints, and operations on them.
 """
 
+import functools
+import math
+import types
+
+import numpy as np
+
+# Human time units and the agent time units they correspond to
+_HUMAN_TO_AGENT_UNITS = {"seconds": "step", "minutes": "cycle", "hours": "epoch"}
+
+
+def _from_base_kernel(bases, to_base):
+    """
+    Canonical coordinates of many base unit values at once.
+
+    Extracts one coordinate column per unit with a vectorized divmod, so the
+    Python loop runs over the units rather than over the values.
+
+    Args:
+        bases: 1-D array of absolute values in base units
+        to_base: 1-D array of factors from each unit to the base unit
+
+    Returns:
+        Array of shape (len(bases), len(to_base)), one row per value
+    """
+    remainder = np.array(bases, dtype=np.result_type(bases, to_base))
+    coords = np.empty((remainder.shape[0], len(to_base)), dtype=remainder.dtype)
+    for i, factor in enumerate(to_base):
+        np.divmod(remainder, factor, out=(coords[:, i], remainder))
+    return coords
+
+
+class Timepoint(dict):
+    """
+    Timepoint dict that remembers its absolute value in base units.
+
+    AgentTemporal returns timepoints of this type. They compare equal to, and
+    can be used anywhere as, plain dicts mapping unit names to values; the
+    remembered value only saves to_base_units from summing the coordinates
+    again. It is tied to the to_base factors it was computed with, so it is
+    ignored by a differently configured AgentTemporal, and it is dropped
+    when the dict is modified.
+    """
+
+    __slots__ = ("_base", "_factors")
+
+    def copy(self):
+        """Return a Timepoint with the same values and remembered base value."""
+        tp = Timepoint(self)
+        tp._base = getattr(self, "_base", None)
+        tp._factors = getattr(self, "_factors", None)
+        return tp
+
+
+def _forgetting_base(method):
+    """Wrap a dict mutator so that it drops the remembered base value."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._factors = None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__ior__",
+    "clear",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+):
+    setattr(Timepoint, _name, _forgetting_base(getattr(dict, _name)))
+del _name
+
+
+class TimepointArray:
+    """
+    Dense storage for many timepoints of one AgentTemporal hierarchy.
+
+    The timepoints are the rows of a single (N, n) array of canonical
+    coordinates in the order of `temporal.units`, rather than N dicts.
+    Rows are read back as Timepoints. The array follows the hierarchy at the
+    time it was created; rebuild it after adapting the hierarchy.
+
+    Example:
+        >>> temporal = AgentTemporal()
+        >>> tps = [temporal.create_timepoint(cycle=i) for i in range(100)]
+        >>> array = TimepointArray.from_timepoints(temporal, tps)
+        >>> array[30]  # {'epoch': 1, 'cycle': 6, 'step': 0, 'microstep': 0}
+    """
+
+    __slots__ = ("temporal", "coords")
+
+    def __init__(self, temporal, coords):
+        """
+        Args:
+            temporal: The AgentTemporal the coordinates belong to
+            coords: Array of shape (N, len(temporal.units)) of canonical
+                coordinates
+        """
+        self.temporal = temporal
+        self.coords = np.asarray(coords)
+
+    @classmethod
+    def from_timepoints(cls, temporal, timepoints):
+        """Build the array from timepoint dicts, normalizing them."""
+        bases = np.array(
+            [temporal.to_base_units(tp) for tp in timepoints],
+            dtype=temporal._to_base_array.dtype,
+        )
+        return cls(temporal, temporal.from_base_units_batch(bases))
+
+    def __len__(self):
+        return len(self.coords)
+
+    def __getitem__(self, index):
+        """Timepoint stored in row index (an int)."""
+        base = self.coords[index] @ self.temporal._to_base_array
+        return self.temporal.from_base_units(base.item())
+
+    def __iter__(self):
+        return map(self.temporal.from_base_units, self.to_base_units().tolist())
+
+    def to_base_units(self):
+        """Absolute values of all rows in the base units."""
+        return self.temporal.to_base_units_batch(self.coords)
+
+    def to_timepoints(self):
+        """All rows as a list of Timepoints."""
+        return list(self)
+
+
+@functools.lru_cache(maxsize=64)
+def _pairwise_factors(names, to_base):
+    """Read-only table of conversion factors between all pairs of units."""
+    return types.MappingProxyType(
+        {
+            (name_a, name_b): factor_a / factor_b
+            for name_a, factor_a in zip(names, to_base)
+            for name_b, factor_b in zip(names, to_base)
+        }
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_conversions(names, to_base):
+    """
+    Generate straight-line base unit conversions for one fixed hierarchy.
+
+    The unit names and to_base factors are inlined as constants, so the
+    generated functions have no loops and no per-call lookups of the
+    hierarchy. Hierarchies with the same structure share the functions.
+
+    Args:
+        names: Unit names in hierarchy order
+        to_base: Factor from each unit to the base unit, in the same order
+
+    Returns:
+        A mapping with:
+            - "from_base": base unit value -> canonical Timepoint
+            - "to_base": timepoint dict -> base unit value, or None unless
+              the dict has exactly one value per unit
+            - "factors": the to_base tuple the Timepoints are stamped with
+    """
+    keys = [repr(name) for name in names]
+    source = ["def from_base(value):"]
+    # Coordinates are always Python ints: float and NumPy values are floored
+    # first, and counts of units finer than the base unit are truncated
+    fractional = any(type(factor) is not int for factor in to_base)
+    if not fractional:
+        source += ["    if type(value) is not int:", "        value = floor(value)"]
+    source.append("    r = value")
+    for i, factor in enumerate(to_base):
+        source.append(f"    c{i}, r = divmod(r, {factor!r})")
+        if fractional:
+            source.append(f"    c{i} = int(c{i})")
+    items = ", ".join(f"{key}: c{i}" for i, key in enumerate(keys))
+    source += [
+        f"    tp = Timepoint({{{items}}})",
+        "    tp._base = value - r",
+        "    tp._factors = FACTORS",
+        "    return tp",
+    ]
+
+    terms = [
+        f"tp[{key}]" if factor == 1 else f"tp[{key}] * {factor!r}"
+        for key, factor in zip(keys, to_base)
+    ]
+    source += [
+        "def to_base(tp):",
+        f"    if len(tp) == {len(names)}:",
+        "        try:",
+        f"            return {' + '.join(terms)}",
+        "        except KeyError:",
+        "            pass",
+        "    return None",
+    ]
+
+    namespace = {"Timepoint": Timepoint, "FACTORS": to_base, "floor": math.floor}
+    exec("\n".join(source), namespace)
+    return {
+        "from_base": namespace["from_base"],
+        "to_base": namespace["to_base"],
+        "factors": to_base,
+    }
+
 
 class AgentTemporal:
     r"""
@@ -56,6 +265,25 @@ class AgentTemporal:
     >>> comparison = temporal.compare_timepoints(t1, t2)  # Returns -1 (t1 < t2)
     """
 
+    # Attributes derived from the unit hierarchy by _compute_conversions
+    _LAYOUT_ATTRS = (
+        "_unit_names",
+        "_to_base_by_index",
+        "_to_base_by_name",
+        "_to_base_array",
+        "_from_base",
+        "_to_base_full",
+        "_zero_template",
+        "_create_limits",
+        "_human_to_base",
+        "_agent_to_human",
+    )
+
+    # Values of _LAYOUT_ATTRS for recently seen hierarchies, shared by all
+    # instances and keyed by _layout_key(); the values are never modified
+    _layout_cache = {}
+    _LAYOUT_CACHE_SIZE = 64
+
     def __init__(self, unit_config=None):
         r"""
         Initialize a new temporal universe with the specified hierarchy of time units.
@@ -95,6 +323,11 @@ class AgentTemporal:
         - See `Temporal Universe </docs/theory/temporal_universe.md#definitions>`_ for
           details on temporal universe structure.
 
+        Raises:
+        ------
+        ValueError
+            If `unit_config` does not mark exactly one unit as the base unit.
+
         Examples:
         --------
 
@@ -126,21 +359,22 @@ class AgentTemporal:
         self.units = unit_config if unit_config else self.default_config
 
         # The base unit is the "finest" partition Pi_n
-        # We'll find which index has is_base == True:
-        self.base_unit_index = next(
-            i for i, u in enumerate(self.units) if u.get("is_base", False)
-        )
+        # We'll find which index has is_base == True, once:
+        base_indices = [i for i, u in enumerate(self.units) if u.get("is_base")]
+        if len(base_indices) != 1:
+            raise ValueError("unit_config must mark exactly one unit with is_base")
+        self.base_unit_index = base_indices[0]
+        self.base_unit_name = self.units[self.base_unit_index]["name"]
 
         # Build a quick mapping from a unit name to its index
         self.unit_indices = {u["name"]: i for i, u in enumerate(self.units)}
 
-        # Precompute conversion factors among all units for quick add/sub
-        self.conversion_factors = {}
+        # Precompute the factor from each unit to the base unit for quick add/sub
         self._compute_conversions()
 
     def _compute_conversions(self):
         r"""
-        Compute conversion factors between all pairs of time units.
+        Compute the conversion factor from every time unit to the base unit.
 
         Mathematical Definition:
         ----------------------
@@ -157,9 +391,9 @@ class AgentTemporal:
         where $|\Pi_i(t)|$ is the size of the partition $\Pi_i$ containing $t$, and
         $k_l$ are the subdivision factors.
 
-        These conversion factors are used to efficiently perform operations like
-        addition, subtraction, and comparison by providing a quick way to convert
-        between different levels of the temporal hierarchy.
+        Only the factors $c_{i,n}$ to the base unit are precomputed; they are all
+        that addition, subtraction and comparison need. The full table of
+        $c_{i,j}$ is built from them on first access to `conversion_factors`.
 
         References:
         ----------
@@ -171,11 +405,33 @@ class AgentTemporal:
         -----
 
         This is an internal method called during initialization and after any
-        structural changes to the temporal hierarchy.
+        structural changes to the temporal hierarchy. Hierarchies seen before,
+        by this or any other instance, reuse the derived tables.
         """
+        key = self._layout_key()
+        state = self._layout_cache.get(key)
+        if state is None:
+            self._derive_conversions()
+            state = tuple(getattr(self, name) for name in self._LAYOUT_ATTRS)
+            cache = self._layout_cache
+            if len(cache) >= self._LAYOUT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = state
+        else:
+            self.__dict__.update(zip(self._LAYOUT_ATTRS, state))
+
+    def _layout_key(self):
+        """Key identifying the current hierarchy in the layout cache."""
+        return (
+            self.base_unit_index,
+            tuple((u["name"], u.get("subdivisions")) for u in self.units),
+        )
+
+    def _derive_conversions(self):
+        """Compute the _LAYOUT_ATTRS tables for the current hierarchy."""
         # Step 1: define how to convert each unit to the base unit
         # e.g., if base unit is microstep, we figure out how many microsteps in one step, cycle, epoch, etc.
-        to_base = [1.0] * len(self.units)
+        to_base = [1] * len(self.units)
 
         # Going from the 'finest' index up to coarser indices:
         # We'll multiply subdivisions as we go up the chain from base to coarser.
@@ -184,30 +440,96 @@ class AgentTemporal:
         # We'll unify the approach by always going from coarsest to finest in code:
         # but actually we can do it from the base up:
 
-        # Start from the base unit:
-        current_factor = 1.0
+        # Start from the base unit. Subdivisions are integers, so these factors
+        # are exact Python ints however deep the hierarchy:
+        current_factor = 1
         # Move outward from base_unit_index to the "left" in the list
         for i in range(self.base_unit_index - 1, -1, -1):
             # Example: if self.units[i] has subdivisions = 1000,
             # it means 1 of self.units[i] = 1000 of self.units[i+1]
             subdiv = self.units[i]["subdivisions"]
-            current_factor *= subdiv
+            current_factor *= int(subdiv)
             to_base[i] = current_factor
 
-        # Move outward from base_unit_index to the "right" in the list
+        # Move outward from base_unit_index to the "right" in the list. Units
+        # finer than the base are fractions of it, the only non-integer factors.
         current_factor = 1.0
         for i in range(self.base_unit_index + 1, len(self.units)):
-            subdiv = self.units[i]["subdivisions"]
-            if subdiv is not None:  # should not be None except for base itself
-                current_factor /= subdiv
+            current_factor /= self.units[i]["subdivisions"]
             to_base[i] = current_factor
 
-        # Step 2: fill in conversion_factors[(unitA, unitB)]
-        # using the ratio of to_base[A]/to_base[B]
-        for i, uA in enumerate(self.units):
-            for j, uB in enumerate(self.units):
-                factor = to_base[i] / to_base[j]
-                self.conversion_factors[(uA["name"], uB["name"])] = factor
+        # Positional form used by the internal conversions, and conversions
+        # specialized to this hierarchy
+        self._unit_names = tuple(u["name"] for u in self.units)
+        compiled = _compile_conversions(self._unit_names, tuple(to_base))
+        self._to_base_by_index = compiled["factors"]
+        self._from_base = compiled["from_base"]
+        self._to_base_full = compiled["to_base"]
+        self._to_base_by_name = dict(zip(self._unit_names, to_base))
+        self._to_base_array = np.asarray(to_base)
+        self._to_base_array.flags.writeable = False
+
+        # Canonical range of each unit, for timepoints created already in
+        # range. The coarsest unit is unbounded; units finer than the base
+        # unit have float factors and always take the normalizing path.
+        self._zero_template = dict.fromkeys(self._unit_names, 0)
+        self._create_limits = {}
+        for i, (name, factor) in enumerate(zip(self._unit_names, to_base)):
+            if isinstance(factor, float):
+                limit = 0
+            elif i == 0:
+                limit = math.inf
+            else:
+                limit = to_base[i - 1] // factor
+            self._create_limits[name] = (factor, limit)
+
+        # Human time units go straight to base units in from_human_time
+        self._human_to_base = {
+            human: self._to_base_by_name[agent]
+            for human, agent in _HUMAN_TO_AGENT_UNITS.items()
+            if agent in self._to_base_by_name
+        }
+        # ... and back in to_human_time, as (agent unit, human unit) pairs
+        # in hierarchy order
+        human_units = {agent: human for human, agent in _HUMAN_TO_AGENT_UNITS.items()}
+        self._agent_to_human = tuple(
+            (name, human_units[name])
+            for name in self._unit_names
+            if name in human_units
+        )
+
+    @property
+    def conversion_factors(self):
+        r"""
+        Conversion factors between all pairs of time units.
+
+        `conversion_factors[(unitA, unitB)]` is how many units of unitB fit
+        into one unit of unitA, i.e. $c_{i,j}$ from `_compute_conversions`.
+        The table is read-only. It is built on first access and shared by all
+        instances with the same hierarchy.
+        """
+        return _pairwise_factors(self._unit_names, self._to_base_by_index)
+
+    @property
+    def base_unit_factors(self):
+        r"""
+        Factor from each unit to the base unit, in the order of `self.units`.
+
+        Entry $i$ equals `conversion_factors[(units[i], base_unit_name)]`. The
+        array is read-only and shared by all instances with the same hierarchy.
+        """
+        return self._to_base_array
+
+    def _kwargs_to_base(self, kwargs):
+        """Absolute value in base units of unit values given as keyword arguments."""
+        to_base = self._to_base_by_name
+        total = 0
+        for k, v in kwargs.items():
+            factor = to_base.get(k)
+            if factor is None:
+                raise ValueError(f"Unknown unit '{k}' in create_timepoint(...)")
+            total += v * factor
+        return total
 
     def create_timepoint(self, **kwargs):
         r"""
@@ -261,15 +583,24 @@ class AgentTemporal:
         >>> # Create with values that need normalization
         >>> t3 = temporal.create_timepoint(cycle=70)  # Normalized to epoch=1, cycle=10
         """
-        # Initialize with 0 for all units
-        tp = {u["name"]: 0 for u in self.units}
-        # Fill any user-provided values
+        limits = self._create_limits
+        total = 0
         for k, v in kwargs.items():
-            if k not in tp:
+            entry = limits.get(k)
+            if entry is None:
                 raise ValueError(f"Unknown unit '{k}' in create_timepoint(...)")
-            tp[k] = v
-        # We'll let normalizing or user calls handle out-of-range values, if any
-        return self.normalize(tp)
+            factor, limit = entry
+            if type(v) is not int or not 0 <= v < limit:
+                # Out-of-range values are normalized through the base units
+                return self._from_base(self._kwargs_to_base(kwargs))
+            total += v * factor
+
+        # Already canonical: units not given count as 0
+        tp = Timepoint(self._zero_template)
+        dict.update(tp, kwargs)
+        tp._base = total
+        tp._factors = self._to_base_by_index
+        return tp
 
     def normalize(self, timepoint):
         r"""
@@ -322,10 +653,16 @@ class AgentTemporal:
         >>> canonical = temporal.normalize(non_canonical)
         >>> # Result: {'epoch': 2, 'cycle': 10, 'step': 30, 'microstep': 0}
         """
+        # Timepoints returned by this class are canonical already
+        if (
+            type(timepoint) is Timepoint
+            and getattr(timepoint, "_factors", None) is self._to_base_by_index
+        ):
+            return timepoint.copy()
         # Convert to the base unit measure
         total_base = self.to_base_units(timepoint)
         # Convert back from base to hierarchical
-        return self.from_base_units(total_base)
+        return self._from_base(total_base)
 
     def to_base_units(self, timepoint):
         r"""
@@ -355,8 +692,10 @@ class AgentTemporal:
 
         Returns:
         -------
-        float
+        int or float
             The absolute representation of the timepoint in the base units.
+            Integer coordinates give an exact int: the base unit factors are
+            ints unless some unit is finer than the base unit.
 
         References:
         ----------
@@ -376,12 +715,22 @@ class AgentTemporal:
         >>> base_units = temporal.to_base_units(tp)
         >>> # Result is 1*24*60*1000 + 10*60*1000 + 30*1000 = 2,070,000
         """
+        # Timepoints returned by this class already know their value
+        if (
+            type(timepoint) is Timepoint
+            and getattr(timepoint, "_factors", None) is self._to_base_by_index
+        ):
+            return timepoint._base
+        total = self._to_base_full(timepoint)
+        if total is not None:
+            return total
+
+        # Partial timepoint: unknown unit names raise KeyError. A plain loop
+        # beats sum() over a generator at these sizes.
+        to_base = self._to_base_by_name
         total = 0
         for unit_name, amount in timepoint.items():
-            factor = self.conversion_factors[
-                (unit_name, self.units[self.base_unit_index]["name"])
-            ]
-            total += amount * factor
+            total += amount * to_base[unit_name]
         return total
 
     def from_base_units(self, base_value):
@@ -403,8 +752,9 @@ class AgentTemporal:
 
         Parameters:
         ----------
-        base_value : float
-            An absolute value in the base units.
+        base_value : int or float
+            An absolute value in the base units. Integer values give integer
+            coordinates.
 
         Returns:
         -------
@@ -429,27 +779,104 @@ class AgentTemporal:
         >>> tp = temporal.from_base_units(base_value)
         >>> # Result: {'epoch': 1, 'cycle': 10, 'step': 30, 'microstep': 0}
         """
-        # We proceed from the coarsest to the base.
-        # We'll produce integer "digits" in each partition's base.
-        # That is the direct analog of the canonical form described in the paper.
-        result = {}
-        remainder = base_value
-        for i, u in enumerate(self.units):
-            # If i is not the last index, we see how many of that unit fit in remainder
-            # using the factor from that unit to the base.
-            conv = self.conversion_factors[
-                (u["name"], self.units[self.base_unit_index]["name"])
-            ]
-            # conv = how many base units is 1 of u
-            if conv != 0:
-                # integer portion of remainder / conv
-                count = int(remainder // conv)
-                result[u["name"]] = count
-                # subtract that from remainder
-                remainder -= count * conv
-            else:
-                result[u["name"]] = 0
-        return result
+        # We proceed from the coarsest to the base, producing the integer
+        # "digits" of the canonical form described in the paper.
+        return self._from_base(base_value)
+
+    def to_base_units_batch(self, coords):
+        r"""
+        Convert many timepoints to their absolute representation at once.
+
+        Mathematical Definition:
+        ----------------------
+
+        Applies the absolute representation function $|\cdot|_{U_n}$ (see
+        `to_base_units`) to every row of `coords`, which for a coordinate
+        matrix $A$ and factor vector $c$ is the product $A c$.
+
+        Parameters:
+        ----------
+        coords : array_like
+            Array of shape (N, len(self.units)) whose rows are timepoint
+            coordinates in the order of `self.units`.
+
+        Returns:
+        -------
+        numpy.ndarray
+            The N absolute values in the base units.
+
+        Examples:
+        --------
+
+        >>> temporal = AgentTemporal()
+        >>> temporal.to_base_units_batch([[1, 10, 30, 0], [0, 0, 1, 0]])
+        >>> # Result: array([2070000, 1000])
+        """
+        return np.asarray(coords) @ self._to_base_array
+
+    def from_base_units_batch(self, bases):
+        r"""
+        Convert many absolute base unit values to timepoints at once.
+
+        Mathematical Definition:
+        ----------------------
+
+        Applies the inverse of the absolute representation function (see
+        `from_base_units`) to each value $|\tau_r|_{U_n}$ in `bases`, giving
+        the canonical coordinates $(a_{r,0}, \ldots, a_{r,n-1})$ of each timepoint.
+
+        Parameters:
+        ----------
+        bases : array_like
+            One-dimensional sequence of absolute values in the base units.
+
+        Returns:
+        -------
+        numpy.ndarray
+            Array of shape (len(bases), len(self.units)) whose row r holds the
+            canonical coordinates of bases[r], in the order of `self.units`.
+            Integer hierarchies give an int64 array.
+
+        Examples:
+        --------
+
+        >>> temporal = AgentTemporal()
+        >>> temporal.from_base_units_batch([2_070_000, 1_000])
+        >>> # Result: array([[1, 10, 30, 0], [0, 0, 1, 0]])
+        """
+        return _from_base_kernel(np.asarray(bases), self._to_base_array)
+
+    def normalize_batch(self, coords):
+        r"""
+        Normalize many timepoints to canonical form at once.
+
+        Mathematical Definition:
+        ----------------------
+
+        Applies the normalization function $\mathcal{N}$ (see `normalize`) to
+        every row of `coords`, through the absolute representation:
+        $\mathcal{N}(\tau_r)$ has the canonical coordinates of $|\tau_r|_{U_n}$.
+
+        Parameters:
+        ----------
+        coords : array_like
+            Array of shape (N, len(self.units)) whose rows are timepoint
+            coordinates in the order of `self.units`, possibly out of range.
+
+        Returns:
+        -------
+        numpy.ndarray
+            Array of the same shape holding the canonical coordinates of each
+            row.
+
+        Examples:
+        --------
+
+        >>> temporal = AgentTemporal()
+        >>> temporal.normalize_batch([[1, 25, 60, 1500], [0, 70, 0, 0]])
+        >>> # Result: array([[2, 2, 1, 500], [2, 22, 0, 0]])
+        """
+        return self.from_base_units_batch(self.to_base_units_batch(coords))
 
     def add_time(self, tp, **kwargs):
         r"""
@@ -507,12 +934,10 @@ class AgentTemporal:
         >>> t3 = temporal.add_time(t1, cycle=55)  # 10+55=65 cycles, normalized to 1 epoch, 5 cycles
         >>> # Result: {'epoch': 2, 'cycle': 5, 'step': 30, 'microstep': 0}
         """
-        base_main = self.to_base_units(tp)
-        # Build an additive timepoint from kwargs, e.g. step=5
-        addition_tp = self.create_timepoint(**kwargs)
-        base_add = self.to_base_units(addition_tp)
-        summed = base_main + base_add
-        return self.from_base_units(summed)
+        # Accumulate kwargs (e.g. step=5) straight into base units rather
+        # than building and normalizing an intermediate timepoint
+        summed = self.to_base_units(tp) + self._kwargs_to_base(kwargs)
+        return self._from_base(summed)
 
     def subtract_time(self, tp, **kwargs):
         r"""
@@ -573,12 +998,10 @@ class AgentTemporal:
         >>> # Result: {'epoch': 1, 'cycle': 59, 'step': 500, 'microstep': 0}
         """
         base_main = self.to_base_units(tp)
-        sub_tp = self.create_timepoint(**kwargs)
-        base_sub = self.to_base_units(sub_tp)
+        base_sub = self._kwargs_to_base(kwargs)
         if base_sub > base_main:
             raise ValueError("Subtraction would produce a negative time result.")
-        result = base_main - base_sub
-        return self.from_base_units(result)
+        return self._from_base(base_main - base_sub)
 
     def compare_timepoints(self, t1, t2):
         r"""
@@ -634,12 +1057,39 @@ class AgentTemporal:
         """
         b1 = self.to_base_units(t1)
         b2 = self.to_base_units(t2)
-        if b1 < b2:
-            return -1
-        elif b1 > b2:
-            return 1
-        else:
-            return 0
+        return (b1 > b2) - (b1 < b2)
+
+    def compare_timepoints_batch(self, coords1, coords2):
+        r"""
+        Compare many pairs of timepoints at once.
+
+        Row-wise counterpart of `compare_timepoints`: the sign of
+        $|\tau_1|_{U_n} - |\tau_2|_{U_n}$ for each pair of rows.
+
+        Parameters:
+        ----------
+        coords1 : array_like
+            Array of shape (N, len(self.units)) of timepoint coordinates in the
+            order of `self.units`.
+        coords2 : array_like
+            Array of the same shape as coords1.
+
+        Returns:
+        -------
+        numpy.ndarray
+            int8 array of N comparison results: -1, 0 or 1 as in
+            `compare_timepoints`.
+
+        Examples:
+        --------
+
+        >>> temporal = AgentTemporal()
+        >>> temporal.compare_timepoints_batch([[1, 10, 30, 0]], [[1, 10, 40, 0]])
+        >>> # Result: array([-1], dtype=int8)
+        """
+        b1 = self.to_base_units_batch(coords1)
+        b2 = self.to_base_units_batch(coords2)
+        return np.sign(b1 - b2).astype(np.int8)
 
     def time_difference(self, t1, t2):
         r"""
@@ -693,8 +1143,17 @@ class AgentTemporal:
         """
         b1 = self.to_base_units(t1)
         b2 = self.to_base_units(t2)
-        diff = abs(b2 - b1)
-        return self.from_base_units(diff)
+        # Against the zero origin the difference is the other timepoint, so a
+        # canonical non-negative one only needs copying
+        if not b1 or not b2:
+            other, base = (t2, b2) if not b1 else (t1, b1)
+            if (
+                base >= 0
+                and type(other) is Timepoint
+                and getattr(other, "_factors", None) is self._to_base_by_index
+            ):
+                return other.copy()
+        return self._from_base(abs(b2 - b1))
 
     # The paper also references mapping to 'human time' (Definitions 16-19).
     # We'll do a simple version here:
@@ -754,15 +1213,16 @@ class AgentTemporal:
         >>> agent_partial = temporal.from_human_time(partial_time)
         >>> # Result: {'epoch': 0, 'cycle': 30, 'step': 0, 'microstep': 0}
         """
-        # Example: you can define your own mapping. For demonstration:
-        known_map = {"seconds": "step", "minutes": "cycle", "hours": "epoch"}
-        agent_tp = {u["name"]: 0 for u in self.units}
+        # Accumulate directly in base units via the mapping in
+        # _HUMAN_TO_AGENT_UNITS, then normalize once
+        human_to_base = self._human_to_base
+        base = 0
         for h_key, val in human_dict.items():
-            if h_key not in known_map:
+            factor = human_to_base.get(h_key)
+            if factor is None:
                 raise ValueError(f"Human unit {h_key} not recognized.")
-            agent_unit = known_map[h_key]
-            agent_tp[agent_unit] = val
-        return self.normalize(agent_tp)
+            base += val * factor
+        return self._from_base(base)
 
     def to_human_time(self, agent_tp):
         r"""
@@ -806,17 +1266,11 @@ class AgentTemporal:
         >>> human_time = temporal.to_human_time(agent_tp)
         >>> # Result: {'hours': 1, 'minutes': 30, 'seconds': 45}
         """
-        known_map = {
-            "step": "seconds",
-            "cycle": "minutes",
-            "epoch": "hours",
-            # microstep could map to "milliseconds" if you like
-        }
-        # Normalize first
-        agent_tp = self.normalize(agent_tp)
-        human_dict = {}
-        for u_name, amount in agent_tp.items():
-            if u_name in known_map:
-                h_key = known_map[u_name]
-                human_dict[h_key] = amount
-        return human_dict
+        # Normalize first, unless this is a timepoint we returned, which is
+        # canonical already (microstep could map to "milliseconds" if you like)
+        if not (
+            type(agent_tp) is Timepoint
+            and getattr(agent_tp, "_factors", None) is self._to_base_by_index
+        ):
+            agent_tp = self._from_base(self.to_base_units(agent_tp))
+        return {human: agent_tp[name] for name, human in self._agent_to_human}
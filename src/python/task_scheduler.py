@@ -5,6 +5,162 @@ This module implements the task scheduling definitions and algorithms
 described in Section 6 of the paper.
 """
 
+import heapq
+
+
+def _topological_order(children_offsets, children_indices, indeg):
+    """
+    Tasks that can be released, each after all of its dependencies (Kahn's
+    algorithm). Arguments are as for `_schedule_core`; indeg is not modified.
+    """
+    remaining = list(indeg)
+    order = [i for i in range(len(remaining)) if remaining[i] == 0]
+    for i in order:  # order grows while it is walked
+        for k in range(children_offsets[i], children_offsets[i + 1]):
+            c = children_indices[k]
+            remaining[c] -= 1
+            if remaining[c] == 0:
+                order.append(c)
+    return order
+
+
+def _dependent_counts(children_offsets, children_indices, indeg):
+    """
+    Number of tasks that depend on each task, directly or transitively.
+
+    Arguments are as for `_schedule_core`; indeg is not modified.
+    """
+    counts = [0] * len(indeg)
+    # Set of the transitive dependents of each task, as a bitmask
+    reach = [0] * len(indeg)
+    for i in reversed(_topological_order(children_offsets, children_indices, indeg)):
+        mask = 0
+        for k in range(children_offsets[i], children_offsets[i + 1]):
+            c = children_indices[k]
+            mask |= reach[c] | (1 << c)
+        reach[i] = mask
+        counts[i] = mask.bit_count()
+    return counts
+
+
+def _critical_path_lengths(durations_base, children_offsets, children_indices, indeg):
+    """
+    Length in base units of the longest dependency chain starting at each task.
+
+    The chain includes the task itself, so a task nothing depends on has its
+    own duration. Arguments are as for `_schedule_core`; indeg is not modified.
+    """
+    lengths = list(durations_base)
+    for i in reversed(_topological_order(children_offsets, children_indices, indeg)):
+        longest = 0
+        for k in range(children_offsets[i], children_offsets[i + 1]):
+            if lengths[children_indices[k]] > longest:
+                longest = lengths[children_indices[k]]
+        lengths[i] += longest
+    return lengths
+
+
+def _schedule_core(durations_base, dep_offsets, dep_indices,
+                   children_offsets, children_indices, indeg, agent_count,
+                   priority=None):
+    """
+    Earliest-start list scheduling of a task graph, on plain integer arrays.
+
+    Tasks are numbered 0..N-1. The dependencies of task i are
+    dep_indices[dep_offsets[i]:dep_offsets[i + 1]] and the tasks depending
+    on it are children_indices[children_offsets[i]:children_offsets[i + 1]].
+    Tasks are released in waves (Kahn's algorithm); each wave is scheduled
+    in task order, or by decreasing priority if given, each task on the
+    earliest available agent.
+
+    Args:
+        durations_base: Duration of each task in base units
+        dep_offsets, dep_indices: Dependencies of each task
+        children_offsets, children_indices: Dependents of each task
+        indeg: Number of unscheduled dependencies of each task (consumed)
+        agent_count: Number of agents available for task execution
+        priority: Optional priority of each task within its wave; ties keep
+                  task order
+
+    Returns:
+        Tuple (order, start_base, end_base, agent) where order lists the
+        scheduled task numbers in scheduling order; it is short of N tasks
+        if some could never be released.
+    """
+    n = len(durations_base)
+    start_base = [0] * n
+    end_base = [0] * n
+    agent = [0] * n
+    # Min-heap of (available from, agent), so ties go to the lowest agent
+    agents = [(0, a) for a in range(agent_count)]
+    order = []
+    if priority is None:
+        wave_key = None
+    else:
+        def wave_key(i):
+            return -priority[i], i
+
+    wave = [i for i in range(n) if indeg[i] == 0]
+    wave.sort(key=wave_key)
+    while wave:
+        next_wave = []
+        for i in wave:
+            # Latest end of the dependencies
+            start = 0
+            for k in range(dep_offsets[i], dep_offsets[i + 1]):
+                if end_base[dep_indices[k]] > start:
+                    start = end_base[dep_indices[k]]
+
+            # Earliest available agent
+            available, a = agents[0]
+            if available > start:
+                start = available
+
+            start_base[i] = start
+            end_base[i] = start + durations_base[i]
+            agent[i] = a
+            heapq.heapreplace(agents, (end_base[i], a))
+            order.append(i)
+
+            # Release the tasks that were only waiting on this one
+            for k in range(children_offsets[i], children_offsets[i + 1]):
+                c = children_indices[k]
+                indeg[c] -= 1
+                if indeg[c] == 0:
+                    next_wave.append(c)
+
+        next_wave.sort(key=wave_key)
+        wave = next_wave
+
+    return order, start_base, end_base, agent
+
+
+def _schedule_independent(durations_base, agent_count, priority=None):
+    """
+    `_schedule_core` for tasks without dependencies.
+
+    All tasks are released at once, so no graph is needed: they are taken in
+    task order, or by decreasing priority if given, and each goes to the
+    earliest available agent. Returns the same tuple as `_schedule_core`.
+    """
+    n = len(durations_base)
+    start_base = [0] * n
+    end_base = [0] * n
+    agent = [0] * n
+    agents = [(0, a) for a in range(agent_count)]
+    if priority is None:
+        order = list(range(n))
+    else:
+        order = sorted(range(n), key=lambda i: (-priority[i], i))
+    for i in order:
+        start, a = agents[0]
+        start_base[i] = start
+        end_base[i] = start + durations_base[i]
+        agent[i] = a
+        heapq.heapreplace(agents, (end_base[i], a))
+    return order, start_base, end_base, agent
+
+
 class TaskScheduler:
     """
     Demonstrates the scheduling concepts from the paper:
@@ -21,6 +177,40 @@ class TaskScheduler:
         self.temporal = temporal_system  # an AgentTemporal instance
         self.tasks = []
 
+    @property
+    def tasks(self):
+        """List of task dicts, in the order they were added."""
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, tasks):
+        self._tasks = tasks
+        # Task of each id, for get_task and the duplicate check in add_task
+        self._tasks_by_id = {t["id"]: t for t in tasks}
+
+    def reset(self):
+        """Remove all tasks, keeping the temporal system."""
+        self._tasks.clear()
+        self._tasks_by_id.clear()
+
+    def get_task(self, task_id):
+        """
+        Look up a task by its id.
+        
+        Args:
+            task_id: Id the task was added with
+
+        Returns:
+            The task dict, with its schedule once schedule() has run
+
+        Raises:
+            ValueError: If no task has this id
+        """
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            raise ValueError(f"Unknown task id '{task_id}'")
+        return task
+
     def add_task(self, task_id, duration, dependencies=None, resources=None):
         """
         Add a task to the scheduler.
@@ -31,13 +221,50 @@ class TaskScheduler:
                       or partial (zeros will be filled in as needed)
             dependencies: List of task_ids that must complete before this task can start
             resources: Dictionary of resource requirements
+
+        Raises:
+            ValueError: If a task with the same id was already added
         """
-        if dependencies is None:
-            dependencies = []
+        if task_id in self._tasks_by_id:
+            raise ValueError(f"Duplicate task id '{task_id}'")
+        task = self._new_task(task_id, duration, dependencies, resources)
+        self.tasks.append(task)
+        self._tasks_by_id[task_id] = task
+
+    def extend_tasks(self, specs):
+        """
+        Add several tasks at once.
+        
+        Args:
+            specs: Iterable of (task_id, duration[, dependencies[, resources]])
+                   tuples, with the arguments of add_task
+
+        Raises:
+            ValueError: If a task id was already added or repeats within specs;
+                        no task is added then
+        """
+        new_tasks = [self._new_task(*spec) for spec in specs]
+        new_by_id = {t["id"]: t for t in new_tasks}
+        if len(new_by_id) != len(new_tasks) or not new_by_id.keys().isdisjoint(
+            self._tasks_by_id
+        ):
+            seen = set(self._tasks_by_id)
+            for t in new_tasks:
+                if t["id"] in seen:
+                    raise ValueError(f"Duplicate task id '{t['id']}'")
+                seen.add(t["id"])
+        self.tasks.extend(new_tasks)
+        self._tasks_by_id.update(new_by_id)
+
+    @staticmethod
+    def _new_task(task_id, duration, dependencies=None, resources=None):
+        """Task dict for the add_task arguments, not yet scheduled."""
+        # Each dependency is kept once, in the order given
+        dependencies = list(dict.fromkeys(dependencies)) if dependencies else []
         if resources is None:
             resources = {}
             
-        self.tasks.append({
+        return {
             "id": task_id,
             "duration": duration,
             "dependencies": dependencies,
@@ -45,94 +272,129 @@ class TaskScheduler:
             "start": None,
             "end": None,
             "agent": None  # Assigned agent, if applicable
-        })
+        }
 
-    def schedule(self, agent_count=1):
+    def schedule(self, agent_count=1, policy="fifo"):
         """
         A simple topological order + earliest start approach:
           - For tasks with no unsatisfied deps, schedule them as soon as possible
           - The 'end' time is start + duration (Theorem 29 about schedule feasibility).
           
+        Tasks whose dependencies are satisfied at the same time are assigned to
+        agents in an order set by the policy:
+          - "fifo": the order in which the tasks were added
+          - "lpt": longest duration first
+          - "cp": longest critical path (chain of dependents) first
+          - "dependents": most tasks depending on it, directly or
+            transitively, first
+        Ties keep the order in which the tasks were added.
+          
         Args:
             agent_count: Number of agents available for task execution
+            policy: "fifo" (default), "lpt", "cp" or "dependents"
             
         Returns:
             List of scheduled tasks with start and end times assigned
         """
-        # Make a copy of tasks to work with
+        if policy not in ("fifo", "lpt", "cp", "dependents"):
+            raise ValueError(f"Unknown scheduling policy '{policy}'")
+
+        # Tasks are numbered in the order they were added
+        tasks = self.tasks
+        # Durations go through create_timepoint so unknown units raise the
+        # same ValueError as add_time
+        to_base = self.temporal.to_base_units
+        create = self.temporal.create_timepoint
+        durations_base = [to_base(create(**t["duration"])) for t in tasks]
+
+        if not any(t["dependencies"] for t in tasks):
+            # Common case: every task is ready at once, so there is no graph
+            # to build. The longest chain from a task is the task itself,
+            # so "cp" orders like "lpt", and no task has dependents.
+            if policy in ("lpt", "cp"):
+                priority = durations_base
+            else:
+                priority = None
+            order, start_base, end_base, agent = _schedule_independent(
+                durations_base, agent_count, priority
+            )
+        else:
+            order, start_base, end_base, agent = self._schedule_graph(
+                durations_base, agent_count, policy
+            )
+        if len(order) != len(tasks):
+            raise ValueError("Dependency cycle detected or unsatisfiable dependencies.")
+
+        # Convert back to timepoints once, at the end. Most tasks start at the
+        # end of another task, so each distinct time is converted only once
+        # and tasks meeting at that time share the timepoint.
+        from_base = self.temporal.from_base_units
+        timepoints = {base: from_base(base) for base in {*start_base, *end_base}}
         scheduled = []
-        unscheduled = self.tasks[:]
-        
-        # Track per-agent availability
-        # Each agent's entry is the timepoint when they become available
-        agent_availability = [
-            self.temporal.create_timepoint() for _ in range(agent_count)
-        ]
-        
-        # Loop until all tasks are scheduled
-        while unscheduled:
-            # Find tasks whose dependencies are all in scheduled
-            ready = [
-                t for t in unscheduled
-                if all(dep in [s["id"] for s in scheduled] for dep in t["dependencies"])
-            ]
-            
-            if not ready:
-                raise ValueError("Dependency cycle detected or unsatisfiable dependencies.")
-            
-            for task in ready:
-                # Find the earliest time this task can start
-                # This is the maximum of:
-                # 1. The completion time of its dependencies
-                # 2. The availability of any agent
-                
-                # Calculate earliest start based on dependencies
-                dep_end_times = []
-                for dep_id in task["dependencies"]:
-                    dep_task = next(s for s in scheduled if s["id"] == dep_id)
-                    dep_end_times.append(dep_task["end"])
-                
-                # If there are dependencies, find latest end time
-                earliest_start = self.temporal.create_timepoint()  # Default to time 0
-                if dep_end_times:
-                    earliest_start = max(
-                        dep_end_times, 
-                        key=lambda t: self.temporal.to_base_units(t)
-                    )
-                
-                # Find the earliest available agent
-                earliest_agent_idx = 0
-                earliest_agent_time = agent_availability[0]
-                
-                for i, availability in enumerate(agent_availability):
-                    if self.temporal.compare_timepoints(availability, earliest_agent_time) < 0:
-                        earliest_agent_idx = i
-                        earliest_agent_time = availability
-                
-                # Final start time is the later of dependency-based and agent-based times
-                if self.temporal.compare_timepoints(earliest_agent_time, earliest_start) > 0:
-                    task_start = earliest_agent_time
-                else:
-                    task_start = earliest_start
-                
-                # Calculate end time
-                task_end = self.temporal.add_time(task_start, **task["duration"])
-                
-                # Update task with scheduling info
-                task["start"] = task_start
-                task["end"] = task_end
-                task["agent"] = earliest_agent_idx
-                
-                # Update agent availability
-                agent_availability[earliest_agent_idx] = task_end
-                
-                # Move task from unscheduled to scheduled
-                scheduled.append(task)
-                unscheduled.remove(task)
-        
+        for i in order:
+            task = tasks[i]
+            task["start"] = timepoints[start_base[i]]
+            task["end"] = timepoints[end_base[i]]
+            task["agent"] = agent[i]
+            scheduled.append(task)
+
+        # Temporal systems that count operations (AdaptiveAgentTemporal) are
+        # credited with the calls scheduling on timepoints makes: per task,
+        # one add_time for its end and one compare_timepoints per agent plus
+        # one against its dependencies. Counted once the schedule is built,
+        # so an adaptation cannot change the hierarchy midway.
+        if getattr(self.temporal, "tracking_enabled", False):
+            track = self.temporal.track_operation_batch
+            track("add", len(tasks))
+            track("compare", len(tasks) * (agent_count + 1))
+
         # Return the tasks in scheduled order
         return scheduled
     
+    def _schedule_graph(self, durations_base, agent_count, policy):
+        """
+        Run `_schedule_core` on the dependency graph of the tasks.
+
+        The graph is flattened into index-based arrays in CSR form; returns
+        the tuple from `_schedule_core`.
+        """
+        tasks = self.tasks
+        index = {t["id"]: i for i, t in enumerate(tasks)}
+        # A dependency on a task that was never added is counted in the
+        # indegree but has no edge, so its dependent is never released
+        indeg = [len(t["dependencies"]) for t in tasks]
+        dep_offsets = [0]
+        dep_indices = []
+        children = [[] for _ in tasks]
+        for i, t in enumerate(tasks):
+            for dep_id in t["dependencies"]:
+                j = index.get(dep_id)
+                if j is not None:
+                    dep_indices.append(j)
+                    children[j].append(i)
+            dep_offsets.append(len(dep_indices))
+        children_offsets = [0]
+        children_indices = []
+        for c in children:
+            children_indices.extend(c)
+            children_offsets.append(len(children_indices))
+
+        if policy == "fifo":
+            priority = None
+        elif policy == "lpt":
+            priority = durations_base
+        elif policy == "cp":
+            priority = _critical_path_lengths(
+                durations_base, children_offsets, children_indices, indeg
+            )
+        else:
+            priority = _dependent_counts(children_offsets, children_indices, indeg)
+
+        return _schedule_core(
+            durations_base, dep_offsets, dep_indices,
+            children_offsets, children_indices, indeg, agent_count, priority
+        )
+
     def visualize_schedule(self):
         """
         Returns data for visualizing the schedule.
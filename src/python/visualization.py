@@ -3,12 +3,15 @@ Visualization tools for the AgentTemporal framework.
 
 This module provides visualization capabilities for timepoints,
 temporal hierarchies, and task schedules.
+
+Matplotlib is imported inside each function rather than at module level:
+it is slow to import and only needed once a figure is drawn.
 """
 
-import matplotlib.pyplot as plt
+from itertools import groupby
+from operator import itemgetter
+
 import numpy as np
-from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.patches import Rectangle
 
 def visualize_temporal_hierarchy(temporal_system, figsize=(10, 6)):
     """
@@ -21,6 +24,9 @@ def visualize_temporal_hierarchy(temporal_system, figsize=(10, 6)):
     Returns:
         matplotlib figure and axes
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
     fig, ax = plt.subplots(figsize=figsize)
     
     # Get unit names
@@ -36,20 +42,37 @@ def visualize_temporal_hierarchy(temporal_system, figsize=(10, 6)):
     ax.set_xlabel('Time')
     ax.set_ylabel('Hierarchical Units')
     
-    # Draw partition boundaries for each unit
+    # Draw partition boundaries for each unit: one horizontal separator per
+    # unit and its subdivision markers, each kind as a single LineCollection
+    n_units = len(units)
+    separators = []
+    markers = []
     for i, unit in enumerate(temporal_system.units[:-1]):  # All except base
         # Get subdivision factor
         subdiv = unit["subdivisions"]
         
-        # Draw horizontal line for this unit
-        ax.axhline(y=i+0.5, color='gray', linestyle='-', alpha=0.3)
+        # Horizontal line for this unit, across the full width
+        separators.append([(0, i + 0.5), (1, i + 0.5)])
         
-        # Draw subdivision markers
-        for j in range(1, subdiv+1):
-            if subdiv <= 24 or j % (subdiv//10) == 0:  # Draw fewer lines for large subdivisions
-                x = j / subdiv
-                ax.axvline(x=x, ymin=(i/len(units)), ymax=((i+1)/len(units)), 
-                          color='blue', linestyle='-', alpha=0.3)
+        # Subdivision markers, spanning this unit's band of the y-axis
+        step = 1 if subdiv <= 24 else subdiv // 10  # Draw fewer lines for large subdivisions
+        xs = np.arange(step, subdiv + 1, step) / subdiv
+        segments = np.empty((len(xs), 2, 2))
+        segments[:, :, 0] = xs[:, np.newaxis]
+        segments[:, 0, 1] = i / n_units
+        segments[:, 1, 1] = (i + 1) / n_units
+        markers.append(segments)
+    
+    # Separators use data y and axes x, markers data x and axes y, and
+    # neither changes the view limits, like axhline and axvline
+    line_style = dict(linestyles='-', alpha=0.3, capstyle='projecting')
+    ax.add_collection(LineCollection(separators, colors='gray',
+                                     transform=ax.get_yaxis_transform(), **line_style),
+                      autolim=False)
+    if markers:
+        ax.add_collection(LineCollection(np.concatenate(markers), colors='blue',
+                                         transform=ax.get_xaxis_transform(), **line_style),
+                          autolim=False)
     
     # Clean up the plot
     ax.spines['top'].set_visible(False)
@@ -72,6 +95,9 @@ def visualize_timepoint(temporal_system, timepoint, figsize=(10, 3)):
     Returns:
         matplotlib figure and axes
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Rectangle
+
     fig, ax = plt.subplots(figsize=figsize)
     
     # Get unit names
@@ -90,26 +116,14 @@ def visualize_timepoint(temporal_system, timepoint, figsize=(10, 3)):
     ax.set_xlabel('Time')
     ax.set_ylabel('Hierarchical Units')
     
-    # Track the position in each unit
-    running_base = 0
-    positions = []
-    
-    # Calculate positions for each unit
-    for i, unit in enumerate(temporal_system.units):
-        # For each unit, calculate where in the timeline it sits
-        if i == len(temporal_system.units) - 1:  # Base unit
-            positions.append((base_value, 1))  # Base unit gets full value
-        else:
-            # Get conversion factor to base
-            factor = temporal_system.conversion_factors[(unit["name"], temporal_system.units[-1]["name"])]
-            # Get the unit value
-            unit_value = timepoint[unit["name"]]
-            # Calculate base units for this unit
-            unit_base = unit_value * factor
-            # Add to positions
-            positions.append((running_base, unit_base))
-            # Update running total
-            running_base += unit_base
+    # Calculate positions for each unit: every unit above the base spans its
+    # value in base units, laid end to end; the base unit sits at base_value
+    factors = temporal_system.base_unit_factors[:-1]
+    values = np.array([timepoint[name] for name in units[:-1]])
+    unit_bases = factors * values
+    starts = np.concatenate(([0], np.cumsum(unit_bases)[:-1]))
+    positions = list(zip(starts.tolist(), unit_bases.tolist()))
+    positions.append((base_value, 1))  # Base unit gets full value
     
     # Draw hierarchical representation
     ax.axvline(x=base_value, color='red', linestyle='-', linewidth=2)
@@ -148,18 +162,19 @@ def visualize_conversions(temporal_system, figsize=(8, 6)):
     Returns:
         matplotlib figure and axes
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LinearSegmentedColormap
+
     fig, ax = plt.subplots(figsize=figsize)
     
     # Get unit names
     units = [u["name"] for u in temporal_system.units]
     n_units = len(units)
     
-    # Create conversion matrix
-    conversion_matrix = np.zeros((n_units, n_units))
-    
-    for i, from_unit in enumerate(units):
-        for j, to_unit in enumerate(units):
-            conversion_matrix[i, j] = temporal_system.conversion_factors[(from_unit, to_unit)]
+    # Create conversion matrix: entry (i, j) is scale_i / scale_j, where
+    # scale is each unit's factor to the base unit
+    scales = temporal_system.base_unit_factors.astype(np.float64)
+    conversion_matrix = np.divide.outer(scales, scales)
     
     # Create logarithmic color map for better visualization
     conversion_matrix = np.log10(conversion_matrix + 1e-10)  # Avoid log(0)
@@ -196,14 +211,16 @@ def visualize_conversions(temporal_system, figsize=(8, 6)):
     ax.set_yticks(np.arange(n_units+1)-.5, minor=True)
     ax.grid(which="minor", color="gray", linestyle='-', linewidth=0.5, alpha=0.3)
     
-    # Add text annotations
-    for i in range(n_units):
-        for j in range(n_units):
-            if conversion_matrix[i, j] > -5:  # Only show reasonable values
-                ax.text(j, i, f"{10**conversion_matrix[i, j]:.1e}",
-                        ha="center", va="center", 
-                        color="black" if conversion_matrix[i, j] < 0 else "white",
-                        fontsize=8)
+    # Add text annotations, only for reasonable values
+    mask = conversion_matrix > -5
+    text_colors = np.where(conversion_matrix < 0, "black", "white")[mask].tolist()
+    texts = [f"{v:.1e}" for v in (10**conversion_matrix[mask]).tolist()]
+    rows, cols = np.nonzero(mask)
+    for text, color, i, j in zip(texts, text_colors, rows.tolist(), cols.tolist()):
+        ax.text(j, i, text,
+                ha="center", va="center", 
+                color=color,
+                fontsize=8)
     
     plt.tight_layout()
     return fig, ax
@@ -219,78 +236,99 @@ def visualize_schedule(scheduler, figsize=(12, 6)):
     Returns:
         matplotlib figure and axes
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PolyCollection
+
     # Get the visualization data
     viz_data = scheduler.visualize_schedule()
     
     # Sort by agent and start time
-    viz_data.sort(key=lambda x: (x["agent"], x["start"]))
+    viz_data.sort(key=itemgetter("agent", "start"))
     
     # Group by agent
-    agents = {}
-    for task in viz_data:
-        agent_id = task["agent"]
-        if agent_id not in agents:
-            agents[agent_id] = []
-        agents[agent_id].append(task)
+    agents = [(agent_id, list(tasks))
+              for agent_id, tasks in groupby(viz_data, key=itemgetter("agent"))]
+    
+    # Latest end time, used to scale the margins
+    max_end = max(task["end"] for task in viz_data)
     
     # Create figure
     fig, ax = plt.subplots(figsize=figsize)
     
-    # Colors for different tasks
+    # Colors for different tasks, picked once per task from the number in its
+    # id; task labels are white on long bars
     colors = plt.cm.tab10.colors
+    n_colors = len(colors)
+    bar_colors = {task["id"]: colors[int(task["id"].replace("T", "")) % n_colors]
+                  for task in viz_data}
+    label_colors = {task["id"]: 'white' if task["duration"] > 100 else 'black'
+                    for task in viz_data}
     
     # Track y-position
     y_pos = 0
-    labels = []
+    label_by_id = {}
+    
+    # Bars are collected here and drawn as one PolyCollection
+    bar_starts = []
+    bar_widths = []
+    bar_rows = []
+    bar_facecolors = []
     
     # Plot tasks for each agent
-    for agent_id, tasks in agents.items():
+    for agent_id, tasks in agents:
         # Add agent label
-        ax.text(-0.01 * max(task["end"] for task in viz_data), 
+        ax.text(-0.01 * max_end, 
                 y_pos + len(tasks)/2, 
                 f"Agent {agent_id}", 
                 va='center', ha='right', fontweight='bold')
         
-        # Plot each task as a rectangle
+        # Plot each task as a bar on its own row
         for i, task in enumerate(tasks):
-            # Create rectangle
-            rect = Rectangle((task["start"], y_pos + i), 
-                             task["duration"], 0.8, 
-                             facecolor=colors[int(task["id"].replace("T", "")) % len(colors)],
-                             alpha=0.7)
-            ax.add_patch(rect)
+            bar_starts.append(task["start"])
+            bar_widths.append(task["duration"])
+            bar_rows.append(y_pos + i)
+            bar_facecolors.append(bar_colors[task["id"]])
             
             # Add task label
             ax.text(task["start"] + task["duration"]/2, 
                     y_pos + i + 0.4, 
                     task["id"], 
                     va='center', ha='center', 
-                    color='white' if task["duration"] > 100 else 'black',
+                    color=label_colors[task["id"]],
                     fontweight='bold')
             
-            # Track label for dependencies
-            labels.append((task["id"], task["start"], task["end"], y_pos + i + 0.4))
+            # Track label position (start, end, y) for dependency arrows
+            label_by_id[task["id"]] = (task["start"], task["end"], y_pos + i + 0.4)
         
         # Update y-position for next agent
         y_pos += len(tasks) + 1
     
+    # Draw all bars at once: corners of each (start, row) to
+    # (start + duration, row + 0.8) rectangle, in Rectangle's vertex order
+    x0 = np.array(bar_starts, dtype=float)
+    x1 = x0 + np.array(bar_widths, dtype=float)
+    y0 = np.array(bar_rows, dtype=float)
+    y1 = y0 + 0.8
+    bars = np.stack([np.column_stack(corner) for corner in
+                     ((x0, y0), (x1, y0), (x1, y1), (x0, y1))], axis=1)
+    ax.add_collection(PolyCollection(bars, facecolors=bar_facecolors, alpha=0.7))
+    
     # Draw dependency arrows
     for task in viz_data:
-        task_label = next(label for label in labels if label[0] == task["id"])
+        task_start, _, task_y = label_by_id[task["id"]]
         
         for dep_id in task["dependencies"]:
-            dep_label = next(label for label in labels if label[0] == dep_id)
+            _, dep_end, dep_y = label_by_id[dep_id]
             
             # Draw arrow from dependency end to task start
             ax.annotate("", 
-                        xy=(task["start"], task_label[3]), 
-                        xytext=(dep_label[2], dep_label[3]),
+                        xy=(task_start, task_y), 
+                        xytext=(dep_end, dep_y),
                         arrowprops=dict(arrowstyle="->", color="gray", alpha=0.5))
     
     # Set axis limits
     ax.set_ylim(0, y_pos)
-    ax.set_xlim(-0.02 * max(task["end"] for task in viz_data), 
-                1.02 * max(task["end"] for task in viz_data))
+    ax.set_xlim(-0.02 * max_end, 1.02 * max_end)
     
     # Remove y-axis ticks
     ax.set_yticks([])
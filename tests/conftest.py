@@ -0,0 +1,25 @@
+"""
+Configuration shared by all tests.
+"""
+
+import os
+
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+# Under pytest-xdist (pytest -n auto) each worker keeps its own example
+# database, so parallel workers never share one directory. The profiles
+# below are registered afterwards and inherit it.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _xdist_worker:
+    settings.register_profile(
+        "default",
+        database=DirectoryBasedExampleDatabase(f".hypothesis/examples-{_xdist_worker}"),
+    )
+    settings.load_profile("default")
+
+# Hypothesis example budgets, selected with --hypothesis-profile=<name>:
+# "ci" for quick runs on shared runners, "thorough" for a deeper search.
+# Without the option Hypothesis uses its default profile.
+settings.register_profile("ci", max_examples=30, deadline=None, database=None)
+settings.register_profile("thorough", max_examples=500, deadline=None)
@@ -3,8 +3,6 @@ Helper script to fix the test_task_scheduler_integration.py file.
 It copies the content from test_temporal_adaptation_effect.py into the right spot.
 """
 
-import re
-
 # Read the original file
 with open("test_task_scheduler_integration.py", "r") as f:
     content = f.read()
@@ -13,28 +11,27 @@ with open("test_task_scheduler_integration.py", "r") as f:
 with open("test_temporal_adaptation_effect.py", "r") as f:
     fixed_method = f.read()
     # Skip the docstring at the top
-    fixed_method = "\n".join(fixed_method.split("\n")[3:])
+    parts = fixed_method.split("\n", 3)
+    fixed_method = parts[3] if len(parts) > 3 else ""
 
 # Find the beginning of the problematic method
-start_pattern = r"def test_temporal_adaptation_effect\(self, adaptive_scheduler, adaptive_temporal\):"
-start_match = re.search(start_pattern, content)
-if not start_match:
+start_pattern = (
+    "def test_temporal_adaptation_effect(self, adaptive_scheduler, adaptive_temporal):"
+)
+start_pos = content.find(start_pattern)
+if start_pos == -1:
     print("Couldn't find the method to replace")
     exit(1)
 
-start_pos = start_match.start()
-
 # Find the beginning of the next method
 next_pattern = (
-    r"def test_scheduling_with_adapted_temporal_system\(self, adaptive_temporal\):"
+    "def test_scheduling_with_adapted_temporal_system(self, adaptive_temporal):"
 )
-next_match = re.search(next_pattern, content)
-if not next_match:
+end_pos = content.find(next_pattern, start_pos)
+if end_pos == -1:
     print("Couldn't find the next method")
     exit(1)
 
-end_pos = next_match.start()
-
 # Replace the method
 new_content = content[:start_pos] + fixed_method + content[end_pos:]
 
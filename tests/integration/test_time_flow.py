@@ -6,8 +6,9 @@ properties, and ensure proper interaction between components.
 """
 
 import pytest
+import numpy as np
 from hypothesis import given, strategies as st
-from hypothesis import settings, HealthCheck
+from hypothesis.extra import numpy as hnp
 import math
 
 # Use direct imports for the unit tests
@@ -164,31 +165,29 @@ class TestBasicTimeOperations:
         assert diff_rev["step"] == 10
 
 
+# Units of the default AgentTemporal, used by timepoint_strategy unless a
+# temporal system is given; built once rather than on every draw
+DEFAULT_UNITS = tuple(AgentTemporal().units)
+
+
 # Define custom strategies for timepoints
-@st.composite
-def timepoint_strategy(draw, temporal_system=None):
+def timepoint_strategy(temporal_system=None):
     """Generate random timepoints that work with the given temporal system."""
-    if temporal_system is None:
-        # Use default AgentTemporal for strategy generation
-        temporal_system = AgentTemporal()
+    units = DEFAULT_UNITS if temporal_system is None else temporal_system.units
 
-    # Get unit names
-    units = [u["name"] for u in temporal_system.units]
-
-    # Generate values for each unit
-    tp = {}
-    for i, unit in enumerate(temporal_system.units):
-        name = unit["name"]
+    # One value strategy per unit, set up once for all draws
+    value_strategies = {}
+    for i, unit in enumerate(units):
         # For all except base unit, respect subdivision limits
-        if i < len(temporal_system.units) - 1:
-            subdiv = unit["subdivisions"]
+        if i < len(units) - 1:
             # Generate values that might need normalization (0 to 2*subdiv)
-            tp[name] = draw(st.integers(min_value=0, max_value=subdiv * 2))
+            max_value = unit["subdivisions"] * 2
         else:
             # Base unit can have a wider range
-            tp[name] = draw(st.integers(min_value=0, max_value=1000))
+            max_value = 1000
+        value_strategies[unit["name"]] = st.integers(min_value=0, max_value=max_value)
 
-    return tp
+    return st.fixed_dictionaries(value_strategies)
 
 
 class TestMathematicalProperties:
@@ -281,6 +280,50 @@ class TestMathematicalProperties:
         assert standard_temporal.compare_timepoints(final_result, t1) == 0
 
 
+# Batches for the batched property tests: rows of coordinates of the
+# standard hierarchy, up to 2000 in every unit so rows need normalization
+BATCH_SIZE = 64
+timepoint_batch = hnp.arrays(
+    np.int64, (BATCH_SIZE, 4), elements=st.integers(min_value=0, max_value=2000)
+)
+
+
+class TestBatchedMathematicalProperties:
+    """Tests for the same properties on whole batches of timepoints at once."""
+
+    @given(coords=timepoint_batch)
+    def test_batch_normalization_matches(self, standard_temporal, coords):
+        """Test that batched normalization agrees with normalize on each timepoint."""
+        names = [u["name"] for u in standard_temporal.units]
+        expected = [
+            list(standard_temporal.normalize(dict(zip(names, row))).values())
+            for row in coords.tolist()
+        ]
+
+        result = standard_temporal.normalize_batch(coords)
+        assert result.tolist() == expected
+        # Normalizing again has no effect
+        assert np.array_equal(standard_temporal.normalize_batch(result), result)
+
+    @given(c1=timepoint_batch, c2=timepoint_batch, c3=timepoint_batch)
+    def test_batch_addition_associativity(self, standard_temporal, c1, c2, c3):
+        """Test that (a + b) + c = a + (b + c) and a + b = b + a row by row."""
+        t1, t2, t3 = (standard_temporal.normalize_batch(c) for c in (c1, c2, c3))
+
+        # Coordinate-wise addition followed by normalization
+        result1 = standard_temporal.normalize_batch(
+            standard_temporal.normalize_batch(t1 + t2) + t3
+        )
+        result2 = standard_temporal.normalize_batch(
+            t1 + standard_temporal.normalize_batch(t2 + t3)
+        )
+        assert not standard_temporal.compare_timepoints_batch(result1, result2).any()
+
+        commuted = standard_temporal.normalize_batch(t2 + t1)
+        sums = standard_temporal.normalize_batch(t1 + t2)
+        assert not standard_temporal.compare_timepoints_batch(sums, commuted).any()
+
+
 class TestTimeUnitConversions:
     """Tests for conversion between different time units."""
 
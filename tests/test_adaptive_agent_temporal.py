@@ -6,7 +6,7 @@ of the paper, including subdivision adjustments and partition reconfiguration.
 """
 
 import pytest
-from src.python.adaptive_agent_temporal import AdaptiveAgentTemporal
+from src.python.adaptive_agent_temporal import AdaptiveAgentTemporal, Op
 
 
 class TestAdaptiveAgentTemporal:
@@ -44,10 +44,95 @@ class TestAdaptiveAgentTemporal:
         assert self.adaptive.operations["compare"] == 1
         assert self.adaptive.op_counter == 3
 
+    def test_tracking_toggle(self):
+        """Test that disabled tracking leaves results unchanged but uncounted"""
+        t1 = self.adaptive.create_timepoint(epoch=1, cycle=12)
+        expected = self.adaptive.add_time(t1, cycle=5)
+        assert self.adaptive.operations["add"] == 1
+
+        self.adaptive.tracking_enabled = False
+        assert self.adaptive.add_time(t1, cycle=5) == expected
+        self.adaptive.compare_timepoints(t1, expected)
+        assert self.adaptive.operations["add"] == 1
+        assert self.adaptive.operations["compare"] == 0
+        assert self.adaptive.op_counter == 1
+
+        self.adaptive.tracking_enabled = True
+        self.adaptive.add_time(t1, cycle=5)
+        assert self.adaptive.operations["add"] == 2
+
+        untracked = AdaptiveAgentTemporal(tracking_enabled=False)
+        untracked.add_time(t1, cycle=5)
+        assert untracked.op_counter == 0
+
+    def test_tracking_toggle_subclass(self):
+        """Test that disabling tracking keeps methods a subclass overrides"""
+
+        class Shifted(AdaptiveAgentTemporal):
+            def add_time(self, timepoint, **kwargs):
+                return super().add_time(timepoint, step=1, **kwargs)
+
+        shifted = Shifted(tracking_enabled=False)
+        t1 = shifted.create_timepoint(cycle=1)
+
+        assert shifted.add_time(t1, cycle=1) == shifted.create_timepoint(
+            cycle=2, step=1
+        )
+        shifted.compare_timepoints(t1, t1)
+        assert shifted.op_counter == 0
+
+        shifted.tracking_enabled = True
+        shifted.compare_timepoints(t1, t1)
+        assert shifted.operations["compare"] == 1
+
+    def test_track_operation_batch(self):
+        """Test that batch tracking matches repeated single tracking"""
+        self.adaptive.adaptation_threshold = 7
+        self.adaptive.track_operation_batch("add", 20, "cycle")
+
+        assert self.adaptive.operations["add"] == 20
+        assert self.adaptive.operations["add:cycle"] == 20
+        assert self.adaptive.op_counter == 20 % 7
+
+    def test_operation_tracking_per_unit(self):
+        """Test per-unit counts and operation types outside Op"""
+        self.adaptive.track_operation("add", "cycle")
+        self.adaptive.track_operation(Op.ADD, "cycle")
+        self.adaptive.track_operation("custom", "step")
+
+        operations = self.adaptive.operations
+        assert operations["add"] == 2
+        assert operations["add:cycle"] == 2
+        assert operations["custom"] == 1
+        assert operations["custom:step"] == 1
+
+        # Per-unit counts follow their unit when the hierarchy changes, and
+        # are kept by name while the unit is not in it
+        self.adaptive.add_time_unit("megacycle", 4, after_unit="epoch")
+        assert self.adaptive.operations["add:cycle"] == 2
+        self.adaptive.remove_time_unit("cycle")
+        assert self.adaptive.operations["add:cycle"] == 2
+        assert self.adaptive.operations["custom:step"] == 1
+        self.adaptive.track_operation("add", "cycle")
+        self.adaptive.track_operation("add", "fortnight")
+        self.adaptive.add_time_unit("cycle", 60, after_unit="epoch")
+        assert self.adaptive.operations["add:cycle"] == 3
+        assert self.adaptive.operations["add:fortnight"] == 1
+
+    def test_operations_read_only(self):
+        """Test that the operations view cannot be written to"""
+        self.adaptive.track_operation("add")
+
+        with pytest.raises(TypeError):
+            self.adaptive.operations["add"] = 5
+        assert self.adaptive.operations["add"] == 1
+        assert self.adaptive.operations["subtract"] == 0
+
     def test_adjust_subdivision(self):
         """Test adjusting subdivision factors"""
         # Initial subdivision for cycle is 60
         assert self.adaptive.units[1]["subdivisions"] == 60
+        tp = self.adaptive.create_timepoint(cycle=1)
 
         # Adjust to a new value
         self.adaptive.adjust_subdivision("cycle", 30)
@@ -63,6 +148,9 @@ class TestAdaptiveAgentTemporal:
         assert cycle_to_base == 30 * 1000
         assert step_to_base == 1000
 
+        # Timepoints created before the change convert with the new factors
+        assert self.adaptive.to_base_units(tp) == 30 * 1000
+
         # Test invalid unit
         with pytest.raises(ValueError):
             self.adaptive.adjust_subdivision("invalid", 10)
@@ -71,6 +159,25 @@ class TestAdaptiveAgentTemporal:
         with pytest.raises(ValueError):
             self.adaptive.adjust_subdivision("microstep", 10)
 
+    def test_batch_adjust(self):
+        """Test that batched adjustments refresh conversion factors on exit"""
+        original = self.adaptive.conversion_factors
+
+        with self.adaptive.batch_adjust():
+            self.adaptive.adjust_subdivision("cycle", 30)
+            self.adaptive.adjust_subdivision("step", 500)
+            # Recomputation is deferred until the block exits
+            assert self.adaptive.conversion_factors is original
+
+        assert self.adaptive.conversion_factors[("cycle", "microstep")] == 30 * 500
+        assert self.adaptive.conversion_factors[("epoch", "microstep")] == 24 * 30 * 500
+
+        # Returning to a known hierarchy reuses the cached table
+        with self.adaptive.batch_adjust():
+            self.adaptive.adjust_subdivision("cycle", 60)
+            self.adaptive.adjust_subdivision("step", 1000)
+        assert self.adaptive.conversion_factors is original
+
     def test_add_time_unit(self):
         """Test adding a new time unit"""
         # Initial unit count
@@ -102,6 +209,23 @@ class TestAdaptiveAgentTemporal:
         with pytest.raises(ValueError):
             self.adaptive.add_time_unit("megacycle", 5, after_unit="epoch")
 
+    def test_batch_reconfigure_units(self):
+        """Test several unit insertions and removals in one batch"""
+        with self.adaptive.batch_adjust():
+            self.adaptive.add_time_unit("megacycle", 4, after_unit="epoch")
+            self.adaptive.add_time_unit("substep", 10, before_unit="microstep")
+            self.adaptive.remove_time_unit("cycle")
+
+        names = [u["name"] for u in self.adaptive.units]
+        assert names == ["epoch", "megacycle", "step", "substep", "microstep"]
+        assert self.adaptive.unit_indices == {name: i for i, name in enumerate(names)}
+        assert self.adaptive.base_unit_index == 4
+        assert len(self.adaptive.optimal_ranges) == 5
+
+        # Conversion factors were refreshed once the batch ended
+        tp = self.adaptive.create_timepoint(epoch=1)
+        assert self.adaptive.to_base_units(tp) == 24 * 4 * 1000 * 10
+
     def test_remove_time_unit(self):
         """Test removing a time unit"""
         # Initial unit count
@@ -5,16 +5,18 @@ These tests validate that the implementation correctly follows the mathematical
 definitions and axioms from the paper.
 """
 
+import numpy as np
 import pytest
-from src.python.agent_temporal import AgentTemporal
+from src.python.agent_temporal import AgentTemporal, TimepointArray
 
 
 class TestAgentTemporal:
     """Test suite for the AgentTemporal class"""
 
-    def setup_method(self):
-        """Set up a temporal system for each test"""
-        self.temporal = AgentTemporal()
+    @classmethod
+    def setup_class(cls):
+        """Set up one temporal system for the class; no test modifies it"""
+        cls.temporal = AgentTemporal()
 
     def test_initialization(self):
         """Test that initialization creates the expected structure"""
@@ -67,6 +69,11 @@ class TestAgentTemporal:
         assert normalized["step"] == 1  # Corrected expectation
         assert normalized["microstep"] == 500
 
+        # A canonical timepoint normalizes to an equal copy
+        again = self.temporal.normalize(normalized)
+        assert again == normalized
+        assert again is not normalized
+
     def test_to_base_units(self):
         """Test conversion to absolute representation (Definition 9)"""
         # Create a timepoint
@@ -99,6 +106,32 @@ class TestAgentTemporal:
         assert tp["step"] == 30
         assert tp["microstep"] == 500
 
+    def test_int_coordinates(self):
+        """Test that float and NumPy inputs still give int coordinates"""
+        tp = self.temporal.create_timepoint(cycle=2)
+        results = {
+            "create_float": self.temporal.create_timepoint(cycle=1.5),
+            "create_numpy": self.temporal.create_timepoint(cycle=np.int64(3)),
+            "from_human": self.temporal.from_human_time({"hours": 1.5}),
+            "add_time": self.temporal.add_time(tp, cycle=0.5),
+            "from_base_float": self.temporal.from_base_units(1500.0),
+            "from_base_numpy": self.temporal.from_base_units(np.int64(1500)),
+        }
+
+        for name, result in results.items():
+            assert all(type(v) is int for v in result.values()), name
+        assert results["create_float"] == {
+            "epoch": 0,
+            "cycle": 1,
+            "step": 30,
+            "microstep": 0,
+        }
+        assert results["create_numpy"]["cycle"] == 3
+        assert results["from_human"]["cycle"] == 12
+        assert results["add_time"]["step"] == 30
+        assert results["from_base_float"] == results["from_base_numpy"]
+        assert results["from_base_float"]["step"] == 1
+
     def test_addition(self):
         """Test temporal addition (Axiom: Temporal Addition)"""
         # Create timepoints
@@ -184,3 +217,124 @@ class TestAgentTemporal:
         assert agent_time["cycle"] == 21  # Corrected expectation
         assert agent_time["step"] == 20
         assert agent_time["microstep"] == 0
+
+    def test_from_base_units_batch(self):
+        """Test batched conversion from absolute to hierarchical"""
+        bases = [3630500, 0, 1000]
+
+        coords = self.temporal.from_base_units_batch(bases)
+
+        assert coords.shape == (3, 4)
+        for row, base in zip(coords, bases):
+            expected = self.temporal.from_base_units(base)
+            assert row.tolist() == [expected[u["name"]] for u in self.temporal.units]
+
+    def test_to_base_units_batch(self):
+        """Test batched conversion to absolute representation"""
+        coords = [[2, 12, 30, 500], [0, 0, 0, 0], [0, 70, 0, 0]]
+
+        bases = self.temporal.to_base_units_batch(coords)
+
+        assert bases.tolist() == [3630500, 0, 70 * 60000]
+
+    def test_normalize_batch(self):
+        """Test batched normalization to canonical form"""
+        coords = [[1, 25, 60, 1500], [0, 70, 0, 0], [2, 12, 30, 500], [0, 0, 0, 0]]
+        names = [u["name"] for u in self.temporal.units]
+
+        normalized = self.temporal.normalize_batch(coords)
+
+        assert normalized.tolist() == [
+            [2, 2, 1, 500],
+            [2, 22, 0, 0],
+            [2, 12, 30, 500],
+            [0, 0, 0, 0],
+        ]
+        for row, raw in zip(normalized.tolist(), coords):
+            expected = self.temporal.normalize(dict(zip(names, raw)))
+            assert row == [expected[name] for name in names]
+
+    def test_compare_timepoints_batch(self):
+        """Test batched comparison of timepoints"""
+        coords1 = [[1, 10, 30, 0], [1, 10, 30, 0], [2, 0, 0, 0]]
+        coords2 = [[1, 10, 40, 0], [1, 10, 30, 0], [1, 23, 59, 999]]
+
+        result = self.temporal.compare_timepoints_batch(coords1, coords2)
+
+        assert result.tolist() == [-1, 0, 1]
+
+    def test_timepoint_remembers_base(self):
+        """Test that returned timepoints carry their base value until modified"""
+        tp = self.temporal.create_timepoint(epoch=1, cycle=10)
+        assert tp == {"epoch": 1, "cycle": 10, "step": 0, "microstep": 0}
+        assert self.temporal.to_base_units(tp) == 1440000 + 600000
+
+        tp["step"] = 5
+        assert self.temporal.to_base_units(tp) == 1440000 + 600000 + 5000
+
+        # A differently configured system does not use the remembered value
+        other = AgentTemporal(
+            [
+                {"name": "epoch", "subdivisions": 10},
+                {"name": "cycle", "subdivisions": 10},
+                {"name": "step", "subdivisions": 10},
+                {"name": "microstep", "subdivisions": None, "is_base": True},
+            ]
+        )
+        tp = self.temporal.create_timepoint(cycle=1)
+        assert other.to_base_units(tp) == 100
+
+    def test_base_unit_required(self):
+        """Test that the configuration must have exactly one base unit"""
+        assert self.temporal.base_unit_name == "microstep"
+
+        with pytest.raises(ValueError):
+            AgentTemporal([{"name": "epoch", "subdivisions": 10}, {"name": "step"}])
+
+    def test_conversion_tables_shared(self):
+        """Test that instances with the same hierarchy share derived tables"""
+        other = AgentTemporal()
+        assert other._to_base_by_index is self.temporal._to_base_by_index
+        assert other.conversion_factors is self.temporal.conversion_factors
+        assert other.conversion_factors[("cycle", "microstep")] == 60000
+
+        with pytest.raises(TypeError):
+            other.conversion_factors[("cycle", "microstep")] = 1
+
+    def test_base_unit_factors(self):
+        """Test the per-unit factors to the base unit"""
+        factors = self.temporal.base_unit_factors
+        assert factors.tolist() == [
+            self.temporal.conversion_factors[(u["name"], "microstep")]
+            for u in self.temporal.units
+        ]
+        assert not factors.flags.writeable
+
+    def test_time_difference_from_origin(self):
+        """Test the difference against the zero timepoint"""
+        origin = self.temporal.create_timepoint()
+        t = self.temporal.create_timepoint(epoch=1, cycle=15, step=30)
+
+        diff = self.temporal.time_difference(origin, t)
+        assert diff == t
+        assert diff is not t
+        assert self.temporal.time_difference(t, origin) == t
+
+        # A non-canonical dict is still normalized
+        assert self.temporal.time_difference({"cycle": 70}, origin) == (
+            self.temporal.create_timepoint(cycle=70)
+        )
+
+    def test_timepoint_array(self):
+        """Test dense storage of many timepoints"""
+        timepoints = [self.temporal.create_timepoint(cycle=i * 7) for i in range(10)]
+
+        array = TimepointArray.from_timepoints(self.temporal, timepoints)
+
+        assert array.coords.shape == (10, 4)
+        assert len(array) == 10
+        assert array[3] == self.temporal.create_timepoint(cycle=21)
+        assert array.to_timepoints() == timepoints
+        assert array.to_base_units().tolist() == [
+            self.temporal.to_base_units(tp) for tp in timepoints
+        ]
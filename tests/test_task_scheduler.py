@@ -5,6 +5,9 @@ These tests validate the scheduling algorithms and constraints defined
 in Section 6 of the paper, including dependency enforcement and agent assignment.
 """
 
+from itertools import groupby
+from operator import itemgetter
+
 import pytest
 from src.python.agent_temporal import AgentTemporal
 from src.python.task_scheduler import TaskScheduler
@@ -13,9 +16,13 @@ from src.python.task_scheduler import TaskScheduler
 class TestTaskScheduler:
     """Test suite for the TaskScheduler class"""
 
+    @classmethod
+    def setup_class(cls):
+        """Set up one temporal system for the class; scheduling never modifies it"""
+        cls.temporal = AgentTemporal()
+
     def setup_method(self):
-        """Set up a temporal system and scheduler for each test"""
-        self.temporal = AgentTemporal()
+        """Set up a scheduler for each test"""
         self.scheduler = TaskScheduler(self.temporal)
 
     def test_initialization(self):
@@ -45,6 +52,75 @@ class TestTaskScheduler:
         assert self.scheduler.tasks[1]["id"] == "T2"
         assert self.scheduler.tasks[1]["dependencies"] == ["T1"]
 
+        # Repeated dependencies are stored once
+        self.scheduler.add_task("T3", {"step": 5}, ["T2", "T1", "T2"])
+        assert self.scheduler.tasks[2]["dependencies"] == ["T2", "T1"]
+
+    def test_add_duplicate_task(self):
+        """Test that task ids must be unique"""
+        self.scheduler.add_task("T1", {"step": 100})
+
+        with pytest.raises(ValueError):
+            self.scheduler.add_task("T1", {"cycle": 1})
+        assert len(self.scheduler.tasks) == 1
+
+        # Replacing the task list frees its ids
+        self.scheduler.tasks = []
+        self.scheduler.add_task("T1", {"cycle": 1})
+        assert len(self.scheduler.tasks) == 1
+
+    def test_extend_tasks(self):
+        """Test adding several tasks at once"""
+        self.scheduler.add_task("T1", {"step": 100})
+        self.scheduler.extend_tasks(
+            [("T2", {"cycle": 2}, ["T1", "T1"]), ("T3", {"step": 5}, (), {"cpu": 1})]
+        )
+
+        assert [t["id"] for t in self.scheduler.tasks] == ["T1", "T2", "T3"]
+        assert self.scheduler.tasks[1]["dependencies"] == ["T1"]
+        assert self.scheduler.tasks[2]["dependencies"] == []
+        assert self.scheduler.tasks[2]["resources"] == {"cpu": 1}
+
+        # A repeated id, new or existing, adds none of the tasks
+        with pytest.raises(ValueError):
+            self.scheduler.extend_tasks([("T4", {"step": 1}), ("T4", {"step": 2})])
+        with pytest.raises(ValueError):
+            self.scheduler.extend_tasks([("T5", {"step": 1}), ("T2", {"step": 2})])
+        assert len(self.scheduler.tasks) == 3
+
+    def test_get_task(self):
+        """Test looking up tasks by id"""
+        self.scheduler.add_task("T1", {"step": 100})
+        self.scheduler.extend_tasks([("T2", {"cycle": 2}, ["T1"])])
+
+        assert self.scheduler.get_task("T2") is self.scheduler.tasks[1]
+        self.scheduler.schedule()
+        t1, t2 = self.scheduler.get_task("T1"), self.scheduler.get_task("T2")
+        assert t2["start"] == t1["end"]
+
+        with pytest.raises(ValueError):
+            self.scheduler.get_task("T3")
+
+        # Replacing the task list replaces the lookup
+        self.scheduler.tasks = []
+        with pytest.raises(ValueError):
+            self.scheduler.get_task("T1")
+
+    def test_reset(self):
+        """Test that reset empties the scheduler"""
+        tasks = self.scheduler.tasks
+        self.scheduler.add_task("T1", {"step": 100})
+        self.scheduler.schedule()
+
+        self.scheduler.reset()
+        assert self.scheduler.tasks is tasks
+        assert len(tasks) == 0
+        assert self.scheduler.temporal is self.temporal
+
+        # Ids of removed tasks can be used again
+        self.scheduler.add_task("T1", {"cycle": 1})
+        assert len(self.scheduler.tasks) == 1
+
     def test_simple_scheduling(self):
         """Test scheduling with one task"""
         # Add a single task
@@ -87,9 +163,10 @@ class TestTaskScheduler:
         assert len(scheduled) == 3
 
         # Find tasks by ID
-        t1 = next(t for t in scheduled if t["id"] == "T1")
-        t2 = next(t for t in scheduled if t["id"] == "T2")
-        t3 = next(t for t in scheduled if t["id"] == "T3")
+        by_id = {t["id"]: t for t in scheduled}
+        t1 = by_id["T1"]
+        t2 = by_id["T2"]
+        t3 = by_id["T3"]
 
         # Check dependency enforcement
         # T1 ends at step 100
@@ -103,6 +180,31 @@ class TestTaskScheduler:
         t2_expected_end = self.temporal.add_time(t2["start"], cycle=1)
         assert t2["end"] == t2_expected_end
 
+    def test_schedule_matches_timepoint_arithmetic(self):
+        """Test that base unit scheduling agrees with add_time and comparisons"""
+        self.scheduler.add_task("T1", {"epoch": 1, "microstep": 7})
+        self.scheduler.add_task("T2", {"cycle": 20})
+        self.scheduler.add_task("T3", {"step": 61}, ["T1", "T2"])
+        self.scheduler.add_task("T4", {"microstep": 1500}, ["T2"])
+
+        scheduled = self.scheduler.schedule(agent_count=2)
+        by_id = {t["id"]: t for t in scheduled}
+
+        for task in scheduled:
+            assert task["end"] == self.temporal.add_time(
+                task["start"], **task["duration"]
+            )
+            for dep_id in task["dependencies"]:
+                assert (
+                    self.temporal.compare_timepoints(
+                        by_id[dep_id]["end"], task["start"]
+                    )
+                    <= 0
+                )
+
+        # T3 waits for the later of its dependencies
+        assert by_id["T3"]["start"] == by_id["T1"]["end"]
+
     def test_cyclic_dependencies(self):
         """Test that cyclic dependencies raise an error"""
         # Add tasks with cyclic dependencies
@@ -114,6 +216,78 @@ class TestTaskScheduler:
         with pytest.raises(ValueError):
             self.scheduler.schedule()
 
+    def test_unknown_dependency(self):
+        """Test that a dependency on a missing task raises an error"""
+        self.scheduler.add_task("T1", {"step": 100})
+        self.scheduler.add_task("T2", {"cycle": 1}, ["T9"])
+
+        with pytest.raises(ValueError):
+            self.scheduler.schedule()
+
+    def test_unknown_duration_unit(self):
+        """Test that a duration in an unknown unit raises an error"""
+        self.scheduler.add_task("T1", {"fortnight": 1})
+
+        with pytest.raises(ValueError):
+            self.scheduler.schedule()
+
+    def test_schedule_order(self):
+        """Test that tasks released together are scheduled in insertion order"""
+        self.scheduler.add_task("T1", {"step": 10})
+        self.scheduler.add_task("T2", {"step": 20})
+        self.scheduler.add_task("T3", {"step": 5}, ["T2"])
+        self.scheduler.add_task("T4", {"step": 5}, ["T1"])
+        self.scheduler.add_task("T5", {"step": 5}, ["T3", "T4"])
+
+        scheduled = self.scheduler.schedule(agent_count=2)
+
+        assert [t["id"] for t in scheduled] == ["T1", "T2", "T3", "T4", "T5"]
+
+    def test_scheduling_policies(self):
+        """Test the order in which simultaneously ready tasks are scheduled"""
+        self.scheduler.add_task("T1", {"step": 5})
+        self.scheduler.add_task("T2", {"step": 1})
+        self.scheduler.add_task("T3", {"step": 1})
+        self.scheduler.add_task("T4", {"step": 10}, ["T2"])
+
+        def order(policy):
+            scheduled = self.scheduler.schedule(agent_count=2, policy=policy)
+            return [t["id"] for t in scheduled]
+
+        assert order("fifo") == ["T1", "T2", "T3", "T4"]
+        assert order("lpt") == ["T1", "T2", "T3", "T4"]
+        # T2 heads the longest chain (T2 -> T4)
+        assert order("cp") == ["T2", "T1", "T3", "T4"]
+        # T2 is the only task with a dependent
+        assert order("dependents") == ["T2", "T1", "T3", "T4"]
+
+        with pytest.raises(ValueError):
+            self.scheduler.schedule(policy="random")
+
+    def test_policy_checked_first(self):
+        """Test that an unknown policy is reported before invalid durations"""
+        self.scheduler.add_task("T1", {"fortnight": 1})
+
+        with pytest.raises(ValueError, match="Unknown scheduling policy"):
+            self.scheduler.schedule(policy="random")
+        with pytest.raises(ValueError, match="Unknown unit 'fortnight'"):
+            self.scheduler.schedule()
+
+    def test_lpt_policy_makespan(self):
+        """Test that longest-first assignment shortens this schedule"""
+        self.scheduler.add_task("T1", {"step": 1})
+        self.scheduler.add_task("T2", {"step": 1})
+        self.scheduler.add_task("T3", {"step": 5})
+
+        def makespan(policy):
+            scheduled = self.scheduler.schedule(agent_count=2, policy=policy)
+            return max(self.temporal.to_base_units(t["end"]) for t in scheduled)
+
+        assert makespan("fifo") == 6000
+        assert makespan("lpt") == 5000
+        # Without dependencies each critical path is the task itself
+        assert makespan("cp") == 5000
+
     def test_multi_agent_scheduling(self):
         """Test scheduling with multiple agents"""
         # Add independent tasks
@@ -131,18 +305,18 @@ class TestTaskScheduler:
         agents_used = set(task["agent"] for task in scheduled)
         assert len(agents_used) <= 2  # Should use at most 2 agents
 
-        # With no dependencies, tasks with same agent shouldn't overlap
-        for i, task1 in enumerate(scheduled):
-            for task2 in scheduled[i + 1 :]:
-                if task1["agent"] == task2["agent"]:
-                    # Either task1 ends before task2 starts or vice versa
-                    comparison = self.temporal.compare_timepoints(
-                        task1["end"], task2["start"]
-                    )
-                    comparison2 = self.temporal.compare_timepoints(
-                        task2["end"], task1["start"]
-                    )
-                    assert comparison <= 0 or comparison2 <= 0
+        # With no dependencies, tasks with same agent shouldn't overlap:
+        # in start order, each task ends before the agent's next one starts
+        to_base = self.temporal.to_base_units
+        intervals = sorted(
+            (task["agent"], to_base(task["start"]), to_base(task["end"]))
+            for task in scheduled
+        )
+        for _, agent_intervals in groupby(intervals, key=itemgetter(0)):
+            previous_end = 0
+            for _, start, end in agent_intervals:
+                assert start >= previous_end
+                previous_end = end
 
     def test_visualize_schedule(self):
         """Test schedule visualization data generation"""
@@ -0,0 +1,239 @@
+"""
+Tests for the TemporalUniverse class.
+
+These tests validate the generated conversion functions against the canonical
+form (Definition 7) and the hierarchical-linear bijection (Theorem 1), and
+check that the batch methods agree with their one-timepoint counterparts.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# The core.temporal package imports modules that do not exist yet, so the
+# universe module is loaded from its file
+_spec = importlib.util.spec_from_file_location(
+    "universe",
+    Path(__file__).resolve().parents[1] / "src" / "core" / "temporal" / "universe.py",
+)
+universe = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(universe)
+TemporalUniverse = universe.TemporalUniverse
+
+
+class TestTemporalUniverse:
+    """Test suite for the TemporalUniverse class"""
+
+    def setup_method(self):
+        """Set up one universe with power-of-two subdivisions and one without"""
+        self.shifted = TemporalUniverse(["a", "b", "c"], [10, 16])
+        self.plain = TemporalUniverse(["a", "b", "c"], [10, 15])
+        self.universes = [self.shifted, self.plain]
+        self.rng = np.random.default_rng(0)
+
+    def random_timepoints(self, count=50):
+        """Non-canonical timepoints as an (count, 3) array"""
+        return self.rng.integers(0, 500, size=(count, 3))
+
+    def test_invalid_hierarchy(self):
+        """Test that invalid hierarchies are rejected"""
+        with pytest.raises(ValueError):
+            TemporalUniverse(["a"], [])
+        with pytest.raises(ValueError):
+            TemporalUniverse(["a", "b"], [10, 10])
+        with pytest.raises(ValueError):
+            TemporalUniverse(["a", "b"], [1])
+
+    def test_create_timepoint(self):
+        """Test creation in canonical form"""
+        tp = self.shifted.create_timepoint(b=25, c=40)
+        assert tp == {"a": 2, "b": 7, "c": 8}
+
+        tp = self.plain.create_timepoint(b=25, c=40)
+        assert tp == {"a": 2, "b": 7, "c": 10}
+
+        with pytest.raises(ValueError):
+            self.shifted.create_timepoint(d=1)
+
+    def test_non_int_components(self):
+        """Test that power-of-two subdivisions accept floats like divmod ones"""
+        for temporal in self.universes:
+            assert temporal.create_timepoint(c=1.5) == {"a": 0, "b": 0, "c": 1.5}
+            assert temporal.create_timepoint(b=10.0) == {"a": 1, "b": 0, "c": 0}
+
+        tp = self.shifted.create_timepoint(a=1, b=9, c=15)
+        assert self.shifted.add_duration(tp, {"c": 1.0}) == {"a": 2, "b": 0, "c": 0}
+        assert self.shifted.absolute_to_timepoint(163.0) == {"a": 1, "b": 0, "c": 3}
+
+        # NumPy integers keep the shift path
+        assert self.shifted.create_timepoint(c=np.int64(40)) == {"a": 0, "b": 2, "c": 8}
+
+    def test_absolute_round_trip(self):
+        """Test the bijection between timepoints and absolute values (Theorem 1)"""
+        assert self.shifted.absolute_to_timepoint(163) == {"a": 1, "b": 0, "c": 3}
+        assert self.shifted.timepoint_to_absolute({"a": 1, "b": 0, "c": 3}) == 163
+
+        for temporal in self.universes:
+            for value in range(0, 2000, 7):
+                tp = temporal.absolute_to_timepoint(value)
+                assert temporal.timepoint_to_absolute(tp) == value
+                assert tp == temporal.normalize_timepoint(tp)
+
+            with pytest.raises(ValueError):
+                temporal.absolute_to_timepoint(-1)
+
+    def test_absolute_of_non_canonical(self):
+        """Test that the absolute value does not depend on the representation"""
+        for temporal in self.universes:
+            tp = {"a": 1, "b": 25, "c": 40}
+            assert temporal.timepoint_to_absolute(tp) == (
+                temporal.timepoint_to_absolute(temporal.normalize_timepoint(tp))
+            )
+
+    def test_add_duration(self):
+        """Test addition with carries (Axiom 2)"""
+        tp = self.shifted.create_timepoint(a=1, b=9, c=15)
+
+        assert self.shifted.add_duration(tp, {"c": 1}) == {"a": 2, "b": 0, "c": 0}
+        assert self.shifted.add_duration(tp, {"b": 1, "c": 2}) == {
+            "a": 2,
+            "b": 1,
+            "c": 1,
+        }
+        # Units the universe does not know are ignored
+        assert self.shifted.add_duration(tp, {"d": 5}) == tp
+
+    def test_subtract_timepoints(self):
+        """Test subtraction (Axiom 3)"""
+        for temporal in self.universes:
+            t1 = temporal.create_timepoint(a=1, b=3, c=4)
+            t2 = temporal.create_timepoint(a=2, b=1, c=2)
+
+            difference = temporal.subtract_timepoints(t2, t1)
+            assert temporal.add_duration(t1, difference) == t2
+
+            with pytest.raises(ValueError):
+                temporal.subtract_timepoints(t1, t2)
+
+    def test_compare_timepoints(self):
+        """Test the ordering (Axiom 1)"""
+        for temporal in self.universes:
+            t1 = temporal.create_timepoint(a=1)
+            t2 = temporal.create_timepoint(b=3)
+
+            assert temporal.compare_timepoints(t1, t2) == 1
+            assert temporal.compare_timepoints(t2, t1) == -1
+            assert temporal.compare_timepoints(t1, {"b": 10}) == 0
+
+    def test_kernels_shared(self):
+        """Test that universes with the same hierarchy share generated functions"""
+        other = TemporalUniverse(["a", "b", "c"], [10, 16])
+        assert other._normalize is self.shifted._normalize
+        assert other._from_absolute is self.shifted._from_absolute
+
+    def test_slots(self):
+        """Test that universes have a fixed attribute set"""
+        assert not hasattr(self.shifted, "__dict__")
+        with pytest.raises(AttributeError):
+            self.shifted.extra = 1
+
+    def test_normalize_batch(self):
+        """Test that batched normalization agrees with normalize_timepoint"""
+        for temporal in self.universes:
+            arr = self.random_timepoints()
+            original = arr.copy()
+
+            result = temporal.normalize_batch(arr)
+
+            expected = [
+                temporal.normalize_timepoint(tp)
+                for tp in temporal.array_to_timepoints(arr)
+            ]
+            assert temporal.array_to_timepoints(result) == expected
+            # The input is left untouched
+            assert (arr == original).all()
+
+    def test_add_duration_batch(self):
+        """Test that batched addition agrees with add_duration"""
+        duration = {"b": 7, "c": 20, "d": 3}
+        for temporal in self.universes:
+            arr = self.random_timepoints()
+
+            result = temporal.add_duration_batch(arr, duration)
+
+            expected = [
+                temporal.add_duration(tp, duration)
+                for tp in temporal.array_to_timepoints(arr)
+            ]
+            assert temporal.array_to_timepoints(result) == expected
+
+    def test_compare_batch(self):
+        """Test that batched comparison agrees with compare_timepoints"""
+        for temporal in self.universes:
+            t1 = self.random_timepoints()
+            t2 = self.random_timepoints()
+            # Equal instants in different representations compare equal
+            t2[0] = temporal.normalize_batch(t1[:1])[0]
+
+            result = temporal.compare_batch(t1, t2)
+
+            expected = [
+                temporal.compare_timepoints(a, b)
+                for a, b in zip(
+                    temporal.array_to_timepoints(t1), temporal.array_to_timepoints(t2)
+                )
+            ]
+            assert result.tolist() == expected
+            assert result[0] == 0
+
+            # A single timepoint is compared against every row
+            single = temporal.compare_batch(t1, t2[0])
+            assert single.tolist() == [
+                temporal.compare_timepoints(tp, temporal.array_to_timepoints(t2)[0])
+                for tp in temporal.array_to_timepoints(t1)
+            ]
+
+    def test_argsort_batch(self):
+        """Test that argsort_batch orders timepoints chronologically"""
+        for temporal in self.universes:
+            arr = self.random_timepoints()
+
+            order = temporal.argsort_batch(arr)
+
+            absolute = [
+                temporal.timepoint_to_absolute(tp)
+                for tp in temporal.array_to_timepoints(arr[order])
+            ]
+            assert absolute == sorted(absolute)
+            assert sorted(order.tolist()) == list(range(len(arr)))
+
+    def test_pack_many(self):
+        """Test that packing many timepoints agrees with pack and unpack"""
+        for temporal in self.universes:
+            timepoints = temporal.array_to_timepoints(self.random_timepoints())
+
+            packed = temporal.pack_many(timepoints)
+
+            assert packed.dtype == np.int64
+            assert packed.tolist() == [temporal.pack(tp) for tp in timepoints]
+            assert temporal.unpack_many(packed) == [
+                temporal.unpack(temporal.pack(tp)) for tp in timepoints
+            ]
+            assert temporal.unpack_many(packed) == [
+                temporal.normalize_timepoint(tp) for tp in timepoints
+            ]
+
+            packed32 = temporal.pack_many(timepoints, dtype=np.int32)
+            assert packed32.dtype == np.int32
+            assert packed32.tolist() == packed.tolist()
+
+    def test_pack_many_overflow(self):
+        """Test that values that do not fit the requested dtype are rejected"""
+        temporal = TemporalUniverse(["a", "b", "c"], [1000, 1000])
+        timepoints = [temporal.create_timepoint(a=3000)]
+
+        assert temporal.pack_many(timepoints).tolist() == [3_000_000_000]
+        with pytest.raises(OverflowError):
+            temporal.pack_many(timepoints, dtype=np.int32)